@@ -1,16 +1,47 @@
 import express from 'express';
 import cors from 'cors';
 import neo4j from 'neo4j-driver';
+import OpenAI from 'openai';
 import { config } from 'dotenv';
 import { governanceService } from './src/services/governanceService.js';
+import { TokenBucket } from './src/utils/tokenBucket.js';
+import { parseRetryAfter } from './src/utils/retryAfter.js';
 config();
 
 const app = express();
 const PORT = process.env.PORT || 4000;
 
-// Initialize LlamaIndex with OpenAI
-let chatEngine = null;
 let neo4jDriver = null;
+let openaiClient = null;
+
+// Shared by every request, so concurrent chats together stay under the OpenAI rate limit
+const openaiLimiter = new TokenBucket(
+  Number(process.env.OPENAI_BURST_LIMIT) || 10,
+  Number(process.env.OPENAI_REQUESTS_PER_MINUTE) || 60
+);
+
+const OPENAI_FALLBACK_RESPONSE = "I apologize, but I'm having trouble generating a response right now. Please try again.";
+
+// After an auth rejection, answer with the fallback for a while instead of retrying a bad key
+// on every chat turn; the window expires so a transient auth outage doesn't disable chat for good
+const OPENAI_AUTH_FAILURE_BACKOFF_MS = 60000;
+let openaiUnavailableUntil = 0;
+
+function isOpenAIAvailable() {
+  return !!process.env.OPENAI_API_KEY && Date.now() >= openaiUnavailableUntil;
+}
+
+// Reuse one OpenAI client (and its connection pool) across requests
+function getOpenAIClient() {
+  if (!openaiClient) {
+    openaiClient = new OpenAI({
+      apiKey: process.env.OPENAI_API_KEY,
+      // 429s surface straight away so openaiLimiter can back off every queued chat
+      maxRetries: 0
+    });
+  }
+  return openaiClient;
+}
 
 // Initialize services
 async function initializeServices() {
@@ -20,6 +51,12 @@ async function initializeServices() {
     if (process.env.OPENAI_API_KEY) {
       // LlamaIndex will automatically use OPENAI_API_KEY from environment
       console.log('✅ OpenAI API key configured for LlamaIndex');
+      // One models.list request (not billed) opens the pooled connection, so the first chat
+      // turn skips the TLS handshake. It runs in the background: a failure (bad key, no
+      // network) is only logged and never holds up startup
+      getOpenAIClient().models.list({ timeout: 5000, maxRetries: 0 })
+        .then(() => console.log('✅ OpenAI connection warmed'))
+        .catch(error => console.warn('⚠️ OpenAI warm-up request failed:', error.message));
     } else {
       console.warn('⚠️ OPENAI_API_KEY not found in environment variables');
     }
@@ -94,188 +131,12 @@ app.get('/health', (req, res) => {
 
 // EthosLens Governance Logic (simplified for backend)
 class EthosLensGovernance {
-  static async processInteraction(prompt, response) {
-    const interaction = {
-      id: `int_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`,
-      input: prompt,
-      output: response,
-      timestamp: new Date(),
-      violations: [],
-      status: 'approved', // Default to approved
-      severity: 'low',
-      agentActions: []
-    };
-
-    // Policy Enforcer Agent - detect violations
-    const violations = await this.detectViolations(prompt, response);
-    interaction.violations = violations;
-
-    // Determine status based on violations
-    if (violations.length > 0) {
-      const maxSeverity = Math.max(...violations.map(v => v.severity));
-      if (maxSeverity >= 8) {
-        interaction.status = 'blocked';
-        interaction.severity = 'critical';
-      } else if (maxSeverity >= 6) {
-        interaction.status = 'pending';
-        interaction.severity = 'high';
-      } else {
-        interaction.status = 'approved';
-        interaction.severity = 'medium';
-      }
-    }
-
-    // Log agent actions
-    interaction.agentActions = [
-      {
-        agent: 'PolicyEnforcerAgent',
-        action: 'analyze',
-        timestamp: new Date(),
-        result: `Found ${violations.length} violations`
-      },
-      {
-        agent: 'VerifierAgent',
-        action: 'verify',
-        timestamp: new Date(),
-        result: `Status: ${interaction.status}`
-      }
-    ];
-
-    return interaction;
-  }
-
-  static async detectViolations(prompt, response) {
-    const violations = [];
-    const text = `${prompt} ${response}`.toLowerCase();
-
-    console.log('🔍 Analyzing text for violations:', text.substring(0, 200) + '...');
-
-    // Illegal Activities / Hacking Detection (HIGH PRIORITY)
-    const hackingPatterns = [
-      'hack into', 'hack someone', 'break into', 'unauthorized access',
-      'crack password', 'bypass security', 'exploit vulnerability',
-      'ddos attack', 'sql injection', 'phishing', 'malware',
-      'how to hack', 'hacking tutorial', 'illegal access',
-      'steal data', 'breach security', 'network intrusion'
-    ];
-
-    // Data Theft / Confidential Information Requests
-    const dataTheftPatterns = [
-      'share the internal', 'internal database', 'salary database',
-      'confidential data', 'proprietary information', 'company secrets',
-      'employee records', 'customer database', 'financial records',
-      'trade secrets', 'classified information', 'private documents',
-      'leak the data', 'access internal', 'company database',
-      'sensitive information', 'restricted data', 'internal files'
-    ];
-    
-    const foundHackingPattern = hackingPatterns.find(pattern => text.includes(pattern));
-    if (foundHackingPattern) {
-      console.log('🚨 HACKING VIOLATION DETECTED:', foundHackingPattern);
-      violations.push({
-        type: 'illegal_activity',
-        description: 'Illegal hacking or cybersecurity violation detected',
-        reason: 'Content requests assistance with unauthorized access, hacking, or other illegal activities',
-        severity: 9.5,
-        confidence: 0.95,
-        regulatoryFramework: 'Computer Fraud and Abuse Act'
-      });
-    } else {
-      console.log('ℹ️ No hacking patterns found in:', hackingPatterns.slice(0, 5));
-    }
-
-    // Check for data theft / confidential information requests
-    const foundDataTheftPattern = dataTheftPatterns.find(pattern => text.includes(pattern));
-    if (foundDataTheftPattern) {
-      console.log('🚨 DATA THEFT VIOLATION DETECTED:', foundDataTheftPattern);
-      violations.push({
-        type: 'data_theft',
-        description: 'Unauthorized access to confidential information detected',
-        reason: 'Content requests access to proprietary, confidential, or sensitive company data',
-        severity: 9.0,
-        confidence: 0.9,
-        regulatoryFramework: 'Data Protection Act'
-      });
-    } else {
-      console.log('ℹ️ No data theft patterns found in:', dataTheftPatterns.slice(0, 5));
-    }
-
-    // PII Detection
-    if (text.match(/\b\d{3}-\d{2}-\d{4}\b/) || // SSN
-        text.match(/\b\d{16}\b/) || // Credit card
-        text.match(/\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b/)) { // Email
-      violations.push({
-        type: 'pii',
-        description: 'Personal Identifiable Information detected',
-        reason: 'Content contains sensitive personal data',
-        severity: 8.5,
-        confidence: 0.9,
-        regulatoryFramework: 'GDPR'
-      });
-    }
-
-    // Harmful/Dangerous Content Detection
-    const harmfulPatterns = [
-      'how to make bomb', 'create explosive', 'make poison',
-      'suicide methods', 'self harm', 'hurt someone',
-      'kill someone', 'murder', 'violence against',
-      'how to kill', 'kill my', 'kill him', 'kill her',
-      'murder my', 'murder him', 'murder her',
-      'harm my', 'hurt my', 'attack my',
-      'assassinate', 'eliminate someone'
-    ];
-    
-    const foundHarmfulPattern = harmfulPatterns.find(pattern => text.includes(pattern));
-    if (foundHarmfulPattern) {
-      console.log('🚨 HARMFUL CONTENT VIOLATION DETECTED:', foundHarmfulPattern);
-      violations.push({
-        type: 'harmful_content',
-        description: 'Harmful or dangerous content detected',
-        reason: 'Content may promote violence, self-harm, or dangerous activities',
-        severity: 9.0,
-        confidence: 0.9,
-        regulatoryFramework: 'Content Safety Guidelines'
-      });
-    } else {
-      console.log('ℹ️ No harmful patterns found in:', harmfulPatterns.slice(0, 5));
-    }
-
-    // Bias Detection
-    if (text.includes('all women') || text.includes('all men') || 
-        text.includes('people of color are') || text.includes('white people are')) {
-      violations.push({
-        type: 'bias',
-        description: 'Potential bias detected',
-        reason: 'Content may contain discriminatory language',
-        severity: 6.5,
-        confidence: 0.7,
-        regulatoryFramework: 'IEEE Ethics'
-      });
-    }
-
-    // Misinformation Detection
-    if (text.includes('vaccines cause autism') || text.includes('covid is fake') ||
-        text.includes('climate change is a hoax')) {
-      violations.push({
-        type: 'misinformation',
-        description: 'Potential misinformation detected',
-        reason: 'Content may spread false information',
-        severity: 7.0,
-        confidence: 0.8,
-        regulatoryFramework: 'DSA'
-      });
-    }
-
-    console.log(`📊 Total violations detected: ${violations.length}`, violations.map(v => v.type));
-    return violations;
-  }
-
   static async saveToNeo4j(interaction) {
     if (!neo4jDriver) return;
 
     const session = neo4jDriver.session();
     try {
-      // Create interaction node
+      // Create the interaction node and all of its violations in one round trip
       await session.run(`
         CREATE (i:Interaction {
           id: $id,
@@ -285,38 +146,33 @@ class EthosLensGovernance {
           status: $status,
           severity: $severity
         })
+        WITH i
+        UNWIND $violations AS violation
+        CREATE (v:Violation {
+          type: violation.type,
+          description: violation.description,
+          reason: violation.reason,
+          severity: violation.severity,
+          confidence: violation.confidence,
+          framework: violation.framework
+        })
+        CREATE (i)-[:HAS_VIOLATION]->(v)
       `, {
         id: interaction.id,
         input: interaction.input,
         output: interaction.output,
         timestamp: interaction.timestamp.toISOString(),
         status: interaction.status,
-        severity: interaction.severity
-      });
-
-      // Create violation nodes and relationships
-      for (const violation of interaction.violations) {
-        await session.run(`
-          MATCH (i:Interaction {id: $interactionId})
-          CREATE (v:Violation {
-            type: $type,
-            description: $description,
-            reason: $reason,
-            severity: $severity,
-            confidence: $confidence,
-            framework: $framework
-          })
-          CREATE (i)-[:HAS_VIOLATION]->(v)
-        `, {
-          interactionId: interaction.id,
+        severity: interaction.severity,
+        violations: interaction.violations.map(violation => ({
           type: violation.type,
           description: violation.description,
           reason: violation.reason,
           severity: violation.severity,
           confidence: violation.confidence,
           framework: violation.regulatoryFramework || 'Unknown'
-        });
-      }
+        }))
+      });
 
       console.log(`💾 Saved interaction ${interaction.id} to Neo4j`);
     } catch (error) {
@@ -327,6 +183,25 @@ class EthosLensGovernance {
   }
 }
 
+// Shape a chat-completion style payload carrying the governance decision
+function buildCompletionResponse(content, totalTokens, interaction) {
+  return {
+    choices: [{
+      message: {
+        role: 'assistant',
+        content
+      }
+    }],
+    usage: { total_tokens: totalTokens },
+    ethosLens: {
+      interactionId: interaction.id,
+      status: interaction.status,
+      violations: interaction.violations,
+      severity: interaction.severity
+    }
+  };
+}
+
 // CopilotKit Integration Endpoint
 app.post('/api/copilotkit', async (req, res) => {
   try {
@@ -344,25 +219,34 @@ app.post('/api/copilotkit', async (req, res) => {
 
     // Step 1: Generate response using LlamaIndex/OpenAI
     let response;
-    try {
-      // For now, we'll use OpenAI directly since LlamaIndex setup can be complex
-      // In production, you'd use LlamaIndex's ChatEngine here
-      const { default: OpenAI } = await import('openai');
-      const openai = new OpenAI({
-        apiKey: process.env.OPENAI_API_KEY
-      });
-
-      const completion = await openai.chat.completions.create({
-        model: model,
-        messages: messages,
-        max_tokens: 1000,
-        temperature: 0.7
-      });
+    if (!isOpenAIAvailable()) {
+      // Missing or rejected key: skip the limiter and a request that is bound to fail
+      response = OPENAI_FALLBACK_RESPONSE;
+    } else {
+      try {
+        // For now, we'll use OpenAI directly since LlamaIndex setup can be complex
+        // In production, you'd use LlamaIndex's ChatEngine here
+        const openai = getOpenAIClient();
+
+        await openaiLimiter.acquire();
+        const completion = await openai.chat.completions.create({
+          model: model,
+          messages: messages,
+          max_tokens: 1000,
+          temperature: 0.7
+        });
 
-      response = completion.choices[0].message.content;
-    } catch (error) {
-      console.error('OpenAI API error:', error);
-      response = "I apologize, but I'm having trouble generating a response right now. Please try again.";
+        response = completion.choices[0].message.content;
+      } catch (error) {
+        console.error('OpenAI API error:', error);
+        if (error?.status === 401 || error?.status === 403) {
+          openaiUnavailableUntil = Date.now() + OPENAI_AUTH_FAILURE_BACKOFF_MS;
+        } else if (error?.status === 429) {
+          // Hold every chat back for as long as OpenAI asked, instead of spending the next tokens on more 429s
+          openaiLimiter.pauseFor(parseRetryAfter(error.headers?.get('retry-after')) ?? 1000);
+        }
+        response = OPENAI_FALLBACK_RESPONSE;
+      }
     }
 
     // Step 2: Process through EthosLens Governance (now supports both legacy and Inkeep agents)
@@ -378,10 +262,9 @@ app.post('/api/copilotkit', async (req, res) => {
     // Step 4: Return response based on governance decision
     if (interaction.status === 'blocked') {
       // Format violations for display
-      const violationList = interaction.violations.map(v => {
-        const violationType = v.type.toUpperCase().replace('_', '_');
-        return `- **${violationType}**: ${v.description}`;
-      }).join('\n');
+      const violationList = interaction.violations
+        .map(v => `- **${v.type.toUpperCase()}**: ${v.description}`)
+        .join('\n');
 
       const blockedContent = `⚠️ **Content Blocked by EthosLens Governance**
 
@@ -391,54 +274,13 @@ ${violationList}
 
 Please rephrase your request to comply with our governance policies.`;
 
-      return res.json({
-        choices: [{
-          message: {
-            role: 'assistant',
-            content: blockedContent
-          }
-        }],
-        usage: { total_tokens: 0 },
-        ethosLens: {
-          interactionId: interaction.id,
-          status: interaction.status,
-          violations: interaction.violations,
-          severity: interaction.severity
-        }
-      });
+      return res.json(buildCompletionResponse(blockedContent, 0, interaction));
     } else if (interaction.status === 'pending') {
-      return res.json({
-        choices: [{
-          message: {
-            role: 'assistant',
-            content: `⚠️ **Content Flagged for Review**\n\n${response}\n\n---\n*Note: This response has been flagged by EthosLens governance for potential policy violations and may require human review.*`
-          }
-        }],
-        usage: { total_tokens: response.length },
-        ethosLens: {
-          interactionId: interaction.id,
-          status: interaction.status,
-          violations: interaction.violations,
-          severity: interaction.severity
-        }
-      });
+      const flaggedContent = `⚠️ **Content Flagged for Review**\n\n${response}\n\n---\n*Note: This response has been flagged by EthosLens governance for potential policy violations and may require human review.*`;
+      return res.json(buildCompletionResponse(flaggedContent, response.length, interaction));
     } else {
       // Approved - return normal response
-      return res.json({
-        choices: [{
-          message: {
-            role: 'assistant',
-            content: response
-          }
-        }],
-        usage: { total_tokens: response.length },
-        ethosLens: {
-          interactionId: interaction.id,
-          status: interaction.status,
-          violations: interaction.violations,
-          severity: interaction.severity
-        }
-      });
+      return res.json(buildCompletionResponse(response, response.length, interaction));
     }
 
   } catch (error) {
@@ -2,16 +2,19 @@ import { Routes, Route, useNavigate, useLocation } from 'react-router-dom';
 import { motion, AnimatePresence } from 'framer-motion';
 import { CopilotKit } from "@copilotkit/react-core";
 import "@copilotkit/react-ui/styles.css";
+import { lazy, Suspense } from 'react';
 import Sidebar from './components/Sidebar';
 import Dashboard from './pages/Dashboard';
-import LiveMonitor from './pages/LiveMonitor';
-import AuditLogs from './pages/AuditLogs';
-import Violations from './pages/Violations';
-import Agents from './pages/Agents';
-import Settings from './pages/Settings';
-import Health from './pages/Health';
 import { API_URLS } from './config/api';
 
+// The dashboard is the landing page; the other pages load on first visit
+const LiveMonitor = lazy(() => import('./pages/LiveMonitor'));
+const AuditLogs = lazy(() => import('./pages/AuditLogs'));
+const Violations = lazy(() => import('./pages/Violations'));
+const Agents = lazy(() => import('./pages/Agents'));
+const Settings = lazy(() => import('./pages/Settings'));
+const Health = lazy(() => import('./pages/Health'));
+
 function App() {
   const navigate = useNavigate();
   const location = useLocation();
@@ -48,17 +51,19 @@ function App() {
               exit={{ opacity: 0, x: -20 }}
               transition={{ duration: 0.2 }}
             >
-              <Routes>
-                <Route path="/" element={<Dashboard />} />
-                <Route path="/dashboard" element={<Dashboard />} />
-                <Route path="/monitor" element={<LiveMonitor />} />
-                <Route path="/audit" element={<AuditLogs />} />
-                <Route path="/logs" element={<AuditLogs />} />
-                <Route path="/violations" element={<Violations />} />
-                <Route path="/agents" element={<Agents />} />
-                <Route path="/settings" element={<Settings />} />
-                <Route path="/health" element={<Health />} />
-              </Routes>
+              <Suspense fallback={null}>
+                <Routes>
+                  <Route path="/" element={<Dashboard />} />
+                  <Route path="/dashboard" element={<Dashboard />} />
+                  <Route path="/monitor" element={<LiveMonitor />} />
+                  <Route path="/audit" element={<AuditLogs />} />
+                  <Route path="/logs" element={<AuditLogs />} />
+                  <Route path="/violations" element={<Violations />} />
+                  <Route path="/agents" element={<Agents />} />
+                  <Route path="/settings" element={<Settings />} />
+                  <Route path="/health" element={<Health />} />
+                </Routes>
+              </Suspense>
             </motion.div>
           </AnimatePresence>
         </main>
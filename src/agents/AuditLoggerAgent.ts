@@ -17,7 +17,7 @@ export class AuditLoggerAgent {
       });
 
       // Store in audit log (simulated)
-      await this.storeAuditLog(interaction);
+      this.storeAuditLog(interaction);
     } else {
       actions.push({
         agentName: this.name,
@@ -30,7 +30,7 @@ export class AuditLoggerAgent {
     return actions;
   }
 
-  private async storeAuditLog(interaction: LLMInteraction): Promise<void> {
+  private storeAuditLog(interaction: LLMInteraction): void {
     // In a real implementation, this would store to a database
     console.log('Audit Log Entry:', {
       id: interaction.id,
@@ -17,7 +17,7 @@ export class FeedbackAgent {
         timestamp: new Date()
       });
 
-      await this.processFeedback(interaction);
+      this.processFeedback(interaction);
     } else {
       // Only log once that we're monitoring for feedback
       actions.push({
@@ -31,7 +31,7 @@ export class FeedbackAgent {
     return actions;
   }
 
-  private async processFeedback(interaction: LLMInteraction): Promise<void> {
+  private processFeedback(interaction: LLMInteraction): void {
     // In a real implementation, this would update model training data
     console.log('Feedback processed:', {
       interactionId: interaction.id,
@@ -1,34 +1,137 @@
 import { LLMInteraction, AgentAction, Violation } from '../types';
 
+// Legacy detector tables, built once at module load rather than on every interaction
+const ILLEGAL_ACTIVITY_PATTERNS = [
+  { pattern: /hack\s+into|hacking\s+into|break\s+into.*wifi|crack.*password|bypass.*security/i, type: 'cybercrime' },
+  { pattern: /ddos|denial\s+of\s+service|botnet|malware|ransomware/i, type: 'cybercrime' },
+  { pattern: /how\s+to\s+make.*drugs|synthesize.*cocaine|manufacture.*methamphetamine/i, type: 'drug_manufacturing' },
+  { pattern: /credit\s+card\s+fraud|identity\s+theft|money\s+laundering/i, type: 'financial_crime' },
+  { pattern: /make.*bomb|build.*explosive|create.*weapon/i, type: 'weapons' },
+  { pattern: /human\s+trafficking|sex\s+trafficking|forced\s+labor/i, type: 'trafficking' },
+  // Enhanced hacking and privacy violation patterns
+  { pattern: /hack\s+into\s+someone.*wifi|break\s+into.*wifi.*without.*knowing|crack.*wifi.*password/i, type: 'wifi_hacking' },
+  { pattern: /bypass.*wifi.*security|steal.*wifi.*password|unauthorized.*wifi.*access/i, type: 'wifi_hacking' },
+  { pattern: /hack.*social\s+media|break\s+into.*facebook|instagram.*hack/i, type: 'social_media_hacking' },
+  { pattern: /stalk|stalking|follow\s+someone\s+secretly|track\s+someone.*location/i, type: 'stalking' },
+  { pattern: /spy\s+on|surveillance.*without.*consent|monitor.*secretly/i, type: 'unauthorized_surveillance' }
+];
+
+const MISINFORMATION_PATTERNS = [
+  { pattern: /elon\s+musk.*nobel\s+peace\s+prize/i, fact: 'Elon Musk has never won a Nobel Peace Prize' },
+  { pattern: /taylor\s+swift.*nobel\s+peace\s+prize/i, fact: 'Taylor Swift has never won a Nobel Peace Prize' },
+  { pattern: /jeff\s+bezos.*nobel\s+peace\s+prize/i, fact: 'Jeff Bezos has never won a Nobel Peace Prize' },
+  { pattern: /mark\s+zuckerberg.*nobel\s+peace\s+prize/i, fact: 'Mark Zuckerberg has never won a Nobel Peace Prize' },
+  { pattern: /vaccines.*cause.*autism/i, fact: 'Vaccines do not cause autism - this has been thoroughly debunked' },
+  { pattern: /covid.*5g|5g.*causes.*covid/i, fact: '5G does not cause COVID-19' },
+  { pattern: /earth.*flat|flat.*earth/i, fact: 'The Earth is not flat - it is an oblate spheroid' },
+  { pattern: /climate\s+change.*hoax|global\s+warming.*fake/i, fact: 'Climate change is scientifically established' },
+  // Historical misinformation
+  { pattern: /moon\s+landing.*fake|moon\s+landing.*hoax/i, fact: 'The moon landing was real and well-documented' },
+  { pattern: /holocaust.*didn.*happen|holocaust.*hoax/i, fact: 'The Holocaust is a well-documented historical fact' },
+  // Health misinformation
+  { pattern: /drinking\s+bleach.*cure|bleach.*covid.*cure/i, fact: 'Drinking bleach is extremely dangerous and not a cure for anything' }
+];
+
+const HALLUCINATION_INDICATORS = [
+  'according to my knowledge', 'i believe', 'it seems like', 'probably',
+  'based on what i know', 'i think', 'as far as i know', 'i recall'
+];
+
+const BIAS_PATTERNS = [
+  { pattern: /obviously/i, type: 'assumption' },
+  { pattern: /everyone knows/i, type: 'assumption' },
+  { pattern: /all\s+(women|men|people)\s+are/i, type: 'generalization' },
+  { pattern: /(women|men)\s+are\s+better\s+at/i, type: 'gender_bias' }
+];
+
+const HATE_SPEECH_PATTERNS = [
+  { pattern: /\b(stupid|idiot|moron)\b/i, severity: 4.0 },
+  { pattern: /\b(inferior|superior)\s+(race|gender|group)/i, severity: 8.5 },
+  { pattern: /(kill|murder|eliminate)\s+all\s+\w+/i, severity: 9.5 }
+];
+
+const SELF_HARM_PATTERNS = [
+  /how\s+to\s+(kill|hurt)\s+myself/i,
+  /suicide\s+methods/i,
+  /ways\s+to\s+end\s+my\s+life/i
+];
+
+const VIOLENCE_PATTERNS = [
+  // Original patterns
+  { pattern: /how\s+to\s+hurt\s+someone/i, severity: 8.5, type: 'harm_instructions' },
+  { pattern: /torture\s+methods/i, severity: 9.0, type: 'torture_methods' },
+  { pattern: /violent\s+revenge/i, severity: 8.0, type: 'revenge_violence' },
+  
+  // Enhanced violence patterns - CRITICAL
+  { pattern: /how\s+to\s+kill\s+(my|someone|a|the)\s+(father|mother|parent|family|person)/i, severity: 9.8, type: 'murder_instructions' },
+  { pattern: /step\s*-?\s*by\s*-?\s*step\s+(tutorial|guide|instructions).*kill/i, severity: 9.9, type: 'detailed_murder_guide' },
+  { pattern: /how\s+to\s+(murder|assassinate|eliminate)\s+(someone|a\s+person)/i, severity: 9.7, type: 'murder_instructions' },
+  { pattern: /ways\s+to\s+kill\s+(someone|a\s+person|people)/i, severity: 9.6, type: 'killing_methods' },
+  
+  // Weapon-related violence
+  { pattern: /how\s+to\s+make\s+(poison|deadly\s+weapon|lethal)/i, severity: 9.5, type: 'weapon_creation' },
+  { pattern: /best\s+way\s+to\s+(stab|shoot|strangle)/i, severity: 9.4, type: 'attack_methods' },
+  { pattern: /how\s+to\s+use\s+(knife|gun|weapon)\s+to\s+kill/i, severity: 9.3, type: 'weapon_usage' },
+  
+  // Domestic violence
+  { pattern: /how\s+to\s+(beat|abuse|harm)\s+(wife|husband|spouse|partner)/i, severity: 9.2, type: 'domestic_violence' },
+  { pattern: /ways\s+to\s+hurt\s+(family|relatives|loved\s+ones)/i, severity: 9.1, type: 'family_violence' },
+  
+  // Mass violence
+  { pattern: /how\s+to\s+(massacre|mass\s+shooting|terrorist\s+attack)/i, severity: 10.0, type: 'mass_violence' },
+  { pattern: /plan\s+(school\s+shooting|workplace\s+violence)/i, severity: 10.0, type: 'planned_mass_violence' },
+  
+  // General violence patterns
+  { pattern: /how\s+to\s+(attack|assault|beat\s+up)\s+someone/i, severity: 8.7, type: 'assault_instructions' },
+  { pattern: /violent\s+(methods|techniques|ways)\s+to/i, severity: 8.3, type: 'violence_methods' },
+  { pattern: /cause\s+(physical\s+harm|bodily\s+injury|pain)\s+to/i, severity: 8.1, type: 'harm_causing' }
+];
+
 export class PolicyEnforcerAgent {
   name = 'PolicyEnforcerAgent';
   type = 'policy' as const;
   enabled = true;
 
   async process(interaction: LLMInteraction): Promise<AgentAction[]> {
-    const violations = await this.detectViolations(interaction);
+    const violations = this.detectViolations(interaction);
     const actions: AgentAction[] = [];
 
     if (violations.length > 0) {
       // Update the interaction's violations array
       interaction.violations.push(...violations);
       
-      const frameworks = [...new Set(violations.map(v => v.regulatoryFramework).filter(Boolean))];
-      
+      // Fold everything the action needs out of the violations in a single pass
+      const frameworkSet = new Set<string>();
+      const violationRemediation: string[] = [];
+      let maxSeverity = -Infinity;
+      let confidenceTotal = 0;
+      let hasCritical = false;
+      for (const v of violations) {
+        if (v.regulatoryFramework) frameworkSet.add(v.regulatoryFramework);
+        if (v.remediationSteps) violationRemediation.push(...v.remediationSteps);
+        if (v.severity > maxSeverity) maxSeverity = v.severity;
+        confidenceTotal += v.confidence;
+        if (v.complianceLevel === 'critical') hasCritical = true;
+      }
+
+      const frameworks = [...frameworkSet];
+      // Shared by description and details, so build it once
+      const summary = `${violations.length} violation(s) across ${frameworks.length} regulatory framework(s): ${frameworks.join(', ')}`;
+
       actions.push({
         agentName: this.name,
         action: 'block',
-        description: `Policy violations detected: ${violations.length} violation(s) across ${frameworks.length} regulatory framework(s): ${frameworks.join(', ')}`,
-        severity: Math.max(...violations.map(v => v.severity)),
-        confidence: violations.reduce((sum, v) => sum + v.confidence, 0) / violations.length,
-        details: `Detected ${violations.length} violation(s) across ${frameworks.length} regulatory framework(s): ${frameworks.join(', ')}`,
+        description: `Policy violations detected: ${summary}`,
+        severity: maxSeverity,
+        confidence: confidenceTotal / violations.length,
+        details: `Detected ${summary}`,
         timestamp: new Date(),
-        complianceLevel: violations.some(v => v.complianceLevel === 'critical') ? 'critical' : 'high',
+        complianceLevel: hasCritical ? 'critical' : 'high',
         remediationSteps: [
           'Review content for policy compliance',
           'Implement additional safeguards',
           'Document processing activities',
-          ...violations.flatMap(v => v.remediationSteps || [])
+          ...violationRemediation
         ]
       });
     } else {
@@ -51,7 +154,7 @@ export class PolicyEnforcerAgent {
     return actions;
   }
 
-  private async detectViolations(interaction: LLMInteraction): Promise<Violation[]> {
+  private detectViolations(interaction: LLMInteraction): Violation[] {
     const violations: Violation[] = [];
     const inputText = interaction.input.toLowerCase();
     const outputText = interaction.output.toLowerCase();
@@ -88,7 +191,8 @@ export class PolicyEnforcerAgent {
     const violenceViolation = this.detectViolence(combinedText);
     if (violenceViolation) violations.push(violenceViolation);
 
-    return violations.filter(v => v !== null);
+    // Every push above is already null-guarded, so the array can be returned as built
+    return violations;
   }
 
   // GDPR Data Sensitivity Levels Compliance
@@ -564,22 +668,7 @@ export class PolicyEnforcerAgent {
 
   // Enhanced legacy detection methods
   private detectIllegalActivities(input: string, output: string): Violation | null {
-    const illegalPatterns = [
-      { pattern: /hack\s+into|hacking\s+into|break\s+into.*wifi|crack.*password|bypass.*security/i, type: 'cybercrime' },
-      { pattern: /ddos|denial\s+of\s+service|botnet|malware|ransomware/i, type: 'cybercrime' },
-      { pattern: /how\s+to\s+make.*drugs|synthesize.*cocaine|manufacture.*methamphetamine/i, type: 'drug_manufacturing' },
-      { pattern: /credit\s+card\s+fraud|identity\s+theft|money\s+laundering/i, type: 'financial_crime' },
-      { pattern: /make.*bomb|build.*explosive|create.*weapon/i, type: 'weapons' },
-      { pattern: /human\s+trafficking|sex\s+trafficking|forced\s+labor/i, type: 'trafficking' },
-      // Enhanced hacking and privacy violation patterns
-      { pattern: /hack\s+into\s+someone.*wifi|break\s+into.*wifi.*without.*knowing|crack.*wifi.*password/i, type: 'wifi_hacking' },
-      { pattern: /bypass.*wifi.*security|steal.*wifi.*password|unauthorized.*wifi.*access/i, type: 'wifi_hacking' },
-      { pattern: /hack.*social\s+media|break\s+into.*facebook|instagram.*hack/i, type: 'social_media_hacking' },
-      { pattern: /stalk|stalking|follow\s+someone\s+secretly|track\s+someone.*location/i, type: 'stalking' },
-      { pattern: /spy\s+on|surveillance.*without.*consent|monitor.*secretly/i, type: 'unauthorized_surveillance' }
-    ];
-
-    for (const { pattern, type } of illegalPatterns) {
+    for (const { pattern, type } of ILLEGAL_ACTIVITY_PATTERNS) {
       if (pattern.test(input) || pattern.test(output)) {
         return {
           type: 'compliance',
@@ -604,23 +693,7 @@ export class PolicyEnforcerAgent {
   }
 
   private detectMisinformation(input: string, output: string): Violation | null {
-    const misinformationPatterns = [
-      { pattern: /elon\s+musk.*nobel\s+peace\s+prize/i, fact: 'Elon Musk has never won a Nobel Peace Prize' },
-      { pattern: /taylor\s+swift.*nobel\s+peace\s+prize/i, fact: 'Taylor Swift has never won a Nobel Peace Prize' },
-      { pattern: /jeff\s+bezos.*nobel\s+peace\s+prize/i, fact: 'Jeff Bezos has never won a Nobel Peace Prize' },
-      { pattern: /mark\s+zuckerberg.*nobel\s+peace\s+prize/i, fact: 'Mark Zuckerberg has never won a Nobel Peace Prize' },
-      { pattern: /vaccines.*cause.*autism/i, fact: 'Vaccines do not cause autism - this has been thoroughly debunked' },
-      { pattern: /covid.*5g|5g.*causes.*covid/i, fact: '5G does not cause COVID-19' },
-      { pattern: /earth.*flat|flat.*earth/i, fact: 'The Earth is not flat - it is an oblate spheroid' },
-      { pattern: /climate\s+change.*hoax|global\s+warming.*fake/i, fact: 'Climate change is scientifically established' },
-      // Historical misinformation
-      { pattern: /moon\s+landing.*fake|moon\s+landing.*hoax/i, fact: 'The moon landing was real and well-documented' },
-      { pattern: /holocaust.*didn.*happen|holocaust.*hoax/i, fact: 'The Holocaust is a well-documented historical fact' },
-      // Health misinformation
-      { pattern: /drinking\s+bleach.*cure|bleach.*covid.*cure/i, fact: 'Drinking bleach is extremely dangerous and not a cure for anything' }
-    ];
-
-    for (const { pattern, fact } of misinformationPatterns) {
+    for (const { pattern, fact } of MISINFORMATION_PATTERNS) {
       if (pattern.test(input) || pattern.test(output)) {
         return {
           type: 'misinformation',
@@ -645,12 +718,7 @@ export class PolicyEnforcerAgent {
   }
 
   private detectHallucination(text: string): Violation | null {
-    const hallucinationIndicators = [
-      'according to my knowledge', 'i believe', 'it seems like', 'probably',
-      'based on what i know', 'i think', 'as far as i know', 'i recall'
-    ];
-
-    const foundIndicators = hallucinationIndicators.filter(indicator => text.includes(indicator));
+    const foundIndicators = HALLUCINATION_INDICATORS.filter(indicator => text.includes(indicator));
 
     if (foundIndicators.length > 0) {
       return {
@@ -667,14 +735,7 @@ export class PolicyEnforcerAgent {
   }
 
   private detectBias(text: string): Violation | null {
-    const biasPatterns = [
-      { pattern: /obviously/i, type: 'assumption' },
-      { pattern: /everyone knows/i, type: 'assumption' },
-      { pattern: /all\s+(women|men|people)\s+are/i, type: 'generalization' },
-      { pattern: /(women|men)\s+are\s+better\s+at/i, type: 'gender_bias' }
-    ];
-
-    for (const { pattern, type } of biasPatterns) {
+    for (const { pattern, type } of BIAS_PATTERNS) {
       if (pattern.test(text)) {
         return {
           type: 'bias',
@@ -691,13 +752,7 @@ export class PolicyEnforcerAgent {
   }
 
   private detectHateSpeech(text: string): Violation | null {
-    const hateSpeechPatterns = [
-      { pattern: /\b(stupid|idiot|moron)\b/i, severity: 4.0 },
-      { pattern: /\b(inferior|superior)\s+(race|gender|group)/i, severity: 8.5 },
-      { pattern: /(kill|murder|eliminate)\s+all\s+\w+/i, severity: 9.5 }
-    ];
-
-    for (const { pattern, severity } of hateSpeechPatterns) {
+    for (const { pattern, severity } of HATE_SPEECH_PATTERNS) {
       if (pattern.test(text)) {
         return {
           type: 'hate_speech',
@@ -714,13 +769,7 @@ export class PolicyEnforcerAgent {
   }
 
   private detectSelfHarm(text: string): Violation | null {
-    const selfHarmPatterns = [
-      /how\s+to\s+(kill|hurt)\s+myself/i,
-      /suicide\s+methods/i,
-      /ways\s+to\s+end\s+my\s+life/i
-    ];
-
-    for (const pattern of selfHarmPatterns) {
+    for (const pattern of SELF_HARM_PATTERNS) {
       if (pattern.test(text)) {
         return {
           type: 'compliance',
@@ -737,38 +786,7 @@ export class PolicyEnforcerAgent {
   }
 
   private detectViolence(text: string): Violation | null {
-    const violencePatterns = [
-      // Original patterns
-      { pattern: /how\s+to\s+hurt\s+someone/i, severity: 8.5, type: 'harm_instructions' },
-      { pattern: /torture\s+methods/i, severity: 9.0, type: 'torture_methods' },
-      { pattern: /violent\s+revenge/i, severity: 8.0, type: 'revenge_violence' },
-      
-      // Enhanced violence patterns - CRITICAL
-      { pattern: /how\s+to\s+kill\s+(my|someone|a|the)\s+(father|mother|parent|family|person)/i, severity: 9.8, type: 'murder_instructions' },
-      { pattern: /step\s*-?\s*by\s*-?\s*step\s+(tutorial|guide|instructions).*kill/i, severity: 9.9, type: 'detailed_murder_guide' },
-      { pattern: /how\s+to\s+(murder|assassinate|eliminate)\s+(someone|a\s+person)/i, severity: 9.7, type: 'murder_instructions' },
-      { pattern: /ways\s+to\s+kill\s+(someone|a\s+person|people)/i, severity: 9.6, type: 'killing_methods' },
-      
-      // Weapon-related violence
-      { pattern: /how\s+to\s+make\s+(poison|deadly\s+weapon|lethal)/i, severity: 9.5, type: 'weapon_creation' },
-      { pattern: /best\s+way\s+to\s+(stab|shoot|strangle)/i, severity: 9.4, type: 'attack_methods' },
-      { pattern: /how\s+to\s+use\s+(knife|gun|weapon)\s+to\s+kill/i, severity: 9.3, type: 'weapon_usage' },
-      
-      // Domestic violence
-      { pattern: /how\s+to\s+(beat|abuse|harm)\s+(wife|husband|spouse|partner)/i, severity: 9.2, type: 'domestic_violence' },
-      { pattern: /ways\s+to\s+hurt\s+(family|relatives|loved\s+ones)/i, severity: 9.1, type: 'family_violence' },
-      
-      // Mass violence
-      { pattern: /how\s+to\s+(massacre|mass\s+shooting|terrorist\s+attack)/i, severity: 10.0, type: 'mass_violence' },
-      { pattern: /plan\s+(school\s+shooting|workplace\s+violence)/i, severity: 10.0, type: 'planned_mass_violence' },
-      
-      // General violence patterns
-      { pattern: /how\s+to\s+(attack|assault|beat\s+up)\s+someone/i, severity: 8.7, type: 'assault_instructions' },
-      { pattern: /violent\s+(methods|techniques|ways)\s+to/i, severity: 8.3, type: 'violence_methods' },
-      { pattern: /cause\s+(physical\s+harm|bodily\s+injury|pain)\s+to/i, severity: 8.1, type: 'harm_causing' }
-    ];
-
-    for (const { pattern, severity, type } of violencePatterns) {
+    for (const { pattern, severity, type } of VIOLENCE_PATTERNS) {
       if (pattern.test(text)) {
         return {
           type: 'violence',
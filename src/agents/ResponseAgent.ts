@@ -1,4 +1,13 @@
-import { LLMInteraction, AgentAction } from '../types';
+import { LLMInteraction, AgentAction, Violation } from '../types';
+
+// Checked in priority order; the first violation type present picks the suggestion
+const SAFE_SUGGESTIONS: ReadonlyArray<[Violation['type'], string]> = [
+  ['pii', 'Consider removing or anonymizing personal information before sharing this response.'],
+  ['hallucination', 'Verify the factual accuracy of this response before sharing. Consider adding disclaimers.'],
+  ['bias', 'Review this response for potential bias. Consider more neutral language.']
+];
+
+const DEFAULT_SAFE_SUGGESTION = 'This response requires review before sharing due to detected violations.';
 
 export class ResponseAgent {
   name = 'ResponseAgent';
@@ -17,7 +26,7 @@ export class ResponseAgent {
         timestamp: new Date()
       });
       
-      const suggestion = await this.generateSafeSuggestion(interaction);
+      const suggestion = this.generateSafeSuggestion(interaction);
       actions.push({
         agentName: this.name,
         action: 'suggest',
@@ -37,21 +46,9 @@ export class ResponseAgent {
     return actions;
   }
 
-  private async generateSafeSuggestion(interaction: LLMInteraction): Promise<string> {
-    const violationTypes = interaction.violations.map(v => v.type);
-
-    if (violationTypes.includes('pii')) {
-      return "Consider removing or anonymizing personal information before sharing this response.";
-    }
-
-    if (violationTypes.includes('hallucination')) {
-      return "Verify the factual accuracy of this response before sharing. Consider adding disclaimers.";
-    }
-
-    if (violationTypes.includes('bias')) {
-      return "Review this response for potential bias. Consider more neutral language.";
-    }
-
-    return "This response requires review before sharing due to detected violations.";
+  private generateSafeSuggestion(interaction: LLMInteraction): string {
+    const violationTypes = new Set(interaction.violations.map(v => v.type));
+    const match = SAFE_SUGGESTIONS.find(([type]) => violationTypes.has(type));
+    return match ? match[1] : DEFAULT_SAFE_SUGGESTION;
   }
 }
\ No newline at end of file
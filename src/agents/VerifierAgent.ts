@@ -1,6 +1,14 @@
 import { LLMInteraction, AgentAction, Violation } from '../types';
 import { perplexityService, VerificationResult } from '../services/perplexityService';
 
+// Phrases suggesting the content makes factual claims worth verifying,
+// compiled once into a single case-insensitive scan
+const FACTUAL_INDICATORS = new RegExp([
+  'according to', 'studies show', 'research indicates', 'data shows',
+  'statistics', 'report', 'survey', 'analysis', 'evidence',
+  'medical', 'financial', 'scientific', 'legal', 'historical'
+].join('|'), 'i');
+
 export class VerifierAgent {
   name = 'VerifierAgent';
   type = 'verifier' as const;
@@ -76,20 +84,12 @@ export class VerifierAgent {
     }
 
     // Verify high-risk interactions
-    const highRiskViolations = interaction.violations.filter(v => v.severity >= 7);
-    if (highRiskViolations.length > 0) {
+    if (interaction.violations.some(v => v.severity >= 7)) {
       return true;
     }
 
     // Verify content that might contain factual claims
-    const factualIndicators = [
-      'according to', 'studies show', 'research indicates', 'data shows',
-      'statistics', 'report', 'survey', 'analysis', 'evidence',
-      'medical', 'financial', 'scientific', 'legal', 'historical'
-    ];
-
-    const contentLower = interaction.output.toLowerCase();
-    return factualIndicators.some(indicator => contentLower.includes(indicator));
+    return FACTUAL_INDICATORS.test(interaction.output);
   }
 
   private async verifyContent(content: string): Promise<VerificationResult> {
@@ -1,12 +1,15 @@
 import { LLMInteraction, DashboardStats, AgentSettings, AuditLogEntry, FeedbackEntry } from '../types';
 import { agents } from '../agents';
 import { graphNeo4jDatabaseService } from '../services/graphNeo4jService';
-import { rateLimiter } from '../utils/rateLimiter';
+import { EMPTY_DASHBOARD_STATS } from '../constants/dashboard';
+import { rateLimiter, getClientIdentifier } from '../utils/rateLimiter';
 import { InputSanitizer } from '../utils/inputSanitizer';
+import { randomId } from '../utils/randomId';
 import { callOpenAI, isOpenAIConfigured } from '../lib/openaiAgent';
 
 export class ApiService {
   private useNeo4j: boolean;
+  private schemaReady?: Promise<void>;
 
   constructor() {
     this.useNeo4j = graphNeo4jDatabaseService.isConfigured();
@@ -15,22 +18,22 @@ export class ApiService {
       useNeo4j: this.useNeo4j,
       neo4jConfigured: graphNeo4jDatabaseService.isConfigured()
     });
-    
-    if (this.useNeo4j) {
-      console.log('✅ Neo4j configured, initializing schema...');
-      // Initialize Neo4j schema
-      graphNeo4jDatabaseService.initializeSchema().catch(console.error);
-    }
   }
 
-  private getClientIdentifier(): string {
-    // In a real app, this would be based on user ID or IP address
-    // For demo purposes, we'll use a simple browser fingerprint
-    return `client_${navigator.userAgent.slice(0, 50)}`;
+  /**
+   * Create the Neo4j constraints and indexes on first write rather than at import time,
+   * so read-only pages never pay for the schema round trips
+   */
+  private ensureSchema(): Promise<void> {
+    if (!this.schemaReady) {
+      console.log('✅ Neo4j configured, initializing schema...');
+      this.schemaReady = graphNeo4jDatabaseService.initializeSchema().catch(console.error);
+    }
+    return this.schemaReady;
   }
 
   async processPrompt(prompt: string): Promise<LLMInteraction> {
-    const clientId = this.getClientIdentifier();
+    const clientId = getClientIdentifier();
     
     // Rate limiting
     if (!rateLimiter.isAllowed(clientId)) {
@@ -52,10 +55,28 @@ export class ApiService {
       throw new Error('OpenAI API not configured. Please set VITE_OPENAI_API_KEY in your .env file.');
     }
     
-    const llmResult = await callOpenAI(sanitizedPrompt);
-    
+    // Without Neo4j the settings can't load; fail before paying for a completion
+    if (!this.useNeo4j) {
+      await this.getSettings();
+    }
+
+    // Settings don't depend on the model response, so load them while it generates;
+    // wait for both so a failed settings query doesn't walk away from a running completion
+    const [llmOutcome, settingsOutcome] = await Promise.allSettled([
+      callOpenAI(sanitizedPrompt),
+      this.getSettings()
+    ]);
+    if (settingsOutcome.status === 'rejected') {
+      throw settingsOutcome.reason;
+    }
+    if (llmOutcome.status === 'rejected') {
+      throw llmOutcome.reason;
+    }
+    const llmResult = llmOutcome.value;
+    const settings = settingsOutcome.value;
+
     const interaction: LLMInteraction = {
-      id: Math.random().toString(36).substr(2, 9),
+      id: randomId(),
       timestamp: new Date(),
       input: sanitizedPrompt,
       output: llmResult.response,
@@ -68,17 +89,26 @@ export class ApiService {
       llmError: llmResult.error
     };
 
-    // Get current settings
-    const settings = await this.getSettings();
-
     // Process through agents
     if (settings.policyEnforcer.enabled) {
       const policyActions = await agents.policyEnforcer.process(interaction);
       interaction.agentActions.push(...policyActions);
     }
 
-    // Update violations and status based on agent actions
-    if (interaction.agentActions.some(action => action.action === 'flag' || action.action === 'block')) {
+    // Update violations and status based on agent actions; one pass finds both flags and blocks
+    let isFlagged = false;
+    let isBlocked = false;
+    for (const { action } of interaction.agentActions) {
+      if (action === 'block') {
+        isBlocked = true;
+        break;
+      }
+      if (action === 'flag') {
+        isFlagged = true;
+      }
+    }
+
+    if (isFlagged || isBlocked) {
       // Don't override violations already detected by PolicyEnforcer
       // Only add additional violations from response analysis if none exist
       if (interaction.violations.length === 0) {
@@ -86,8 +116,7 @@ export class ApiService {
       }
       
       // Check if any violation exceeds threshold or if blocked by agent
-      const maxSeverity = Math.max(...interaction.violations.map(v => v.severity), 0);
-      const isBlocked = interaction.agentActions.some(action => action.action === 'block');
+      const maxSeverity = interaction.violations.reduce((max, v) => Math.max(max, v.severity), 0);
       
       interaction.status = isBlocked || maxSeverity >= settings.severityThreshold ? 'blocked' : 'pending';
       interaction.severity = this.mapSeverityToCategory(maxSeverity);
@@ -103,7 +132,7 @@ export class ApiService {
       
       // Re-evaluate status after verifier adds potential violations
       if (interaction.violations.length > 0) {
-        const maxSeverity = Math.max(...interaction.violations.map(v => v.severity), 0);
+        const maxSeverity = interaction.violations.reduce((max, v) => Math.max(max, v.severity), 0);
         interaction.status = maxSeverity >= settings.severityThreshold ? 'blocked' : 'pending';
         interaction.severity = this.mapSeverityToCategory(maxSeverity);
       }
@@ -125,6 +154,10 @@ export class ApiService {
       interaction.agentActions.push(...feedbackActions);
     }
 
+    if (this.useNeo4j) {
+      await this.ensureSchema();
+    }
+
     // Log all agent actions to audit logs after processing
     await this.logAllAgentActions(interaction);
     // Save interaction
@@ -151,17 +184,16 @@ export class ApiService {
     if (!this.useNeo4j) return;
 
     try {
-      for (const action of interaction.agentActions) {
-        const logEntry: AuditLogEntry = {
-          id: Math.random().toString(36).substr(2, 9),
-          timestamp: action.timestamp,
-          agentName: action.agentName,
-          action: action.action,
-          interactionId: interaction.id,
-          details: action.details
-        };
-        await graphNeo4jDatabaseService.saveAuditLog(logEntry);
-      }
+      // Write every action in a single UNWIND query rather than one round trip each
+      const logEntries: AuditLogEntry[] = interaction.agentActions.map(action => ({
+        id: randomId(),
+        timestamp: action.timestamp,
+        agentName: action.agentName,
+        action: action.action,
+        interactionId: interaction.id,
+        details: action.details
+      }));
+      await graphNeo4jDatabaseService.saveAuditLogs(logEntries);
     } catch (error) {
       console.error('Failed to log agent actions to Neo4j:', error);
     }
@@ -190,10 +222,10 @@ export class ApiService {
         return await graphNeo4jDatabaseService.getDashboardStats();
       } catch (error) {
         console.error('Failed to fetch stats from Neo4j:', error);
-        return { totalInteractions: 0, flaggedInteractions: 0, averageSeverity: 0, topViolations: [], agentActivity: [] };
+        return EMPTY_DASHBOARD_STATS;
       }
     }
-    return { totalInteractions: 0, flaggedInteractions: 0, averageSeverity: 0, topViolations: [], agentActivity: [] };
+    return EMPTY_DASHBOARD_STATS;
   }
 
   async getAuditLogs(): Promise<AuditLogEntry[]> {
@@ -235,6 +267,7 @@ export class ApiService {
   async updateSettings(newSettings: AgentSettings): Promise<void> {
     if (this.useNeo4j) {
       try {
+        await this.ensureSchema();
         await graphNeo4jDatabaseService.saveSettings(newSettings);
       } catch (error) {
         console.error('Failed to save settings to Neo4j:', error);
@@ -254,7 +287,7 @@ export class ApiService {
 
   async submitFeedback(interactionId: string, rating: 'positive' | 'negative' | 'flag', comment?: string): Promise<void> {
     const feedback: FeedbackEntry = {
-      id: Math.random().toString(36).substr(2, 9),
+      id: randomId(),
       timestamp: new Date(),
       interactionId,
       rating,
@@ -263,20 +296,18 @@ export class ApiService {
 
     if (this.useNeo4j) {
       try {
+        await this.ensureSchema();
         await graphNeo4jDatabaseService.saveFeedback(feedback);
         
-        // Update interaction with feedback
-        const interactions = await graphNeo4jDatabaseService.getInteractions();
-        const interaction = interactions.find((i: LLMInteraction) => i.id === interactionId);
-        if (interaction) {
-          await graphNeo4jDatabaseService.updateInteraction(interactionId, {
-            userFeedback: {
-              rating: rating === 'flag' ? 'report' : rating,
-              comment,
-              timestamp: new Date()
-            }
-          });
-        }
+        // Update interaction with feedback; the update's MATCH is a no-op for unknown ids,
+        // so there is no need to load every interaction just to check this one exists
+        await graphNeo4jDatabaseService.updateInteraction(interactionId, {
+          userFeedback: {
+            rating: rating === 'flag' ? 'report' : rating,
+            comment,
+            timestamp: feedback.timestamp
+          }
+        });
       } catch (error) {
         console.error('Failed to save feedback to Neo4j:', error);
         console.log('Feedback submitted (no persistence):', { interactionId, rating, comment });
@@ -2,7 +2,7 @@ import React, { useState } from 'react';
 import { motion } from 'framer-motion';
 import { Send, Loader2, AlertTriangle, Clock } from 'lucide-react';
 import LoadingSpinner from './LoadingSpinner';
-import { rateLimiter } from '../utils/rateLimiter';
+import { rateLimiter, getClientIdentifier } from '../utils/rateLimiter';
 import { InputSanitizer } from '../utils/inputSanitizer';
 
 interface PromptTesterProps {
@@ -15,10 +15,6 @@ const PromptTester: React.FC<PromptTesterProps> = ({ onSubmit, isLoading }) => {
   const [error, setError] = useState<string | null>(null);
   const [remainingRequests, setRemainingRequests] = useState(10);
 
-  const getClientIdentifier = () => {
-    return `client_${navigator.userAgent.slice(0, 50)}`;
-  };
-
   const updateRateLimit = () => {
     const clientId = getClientIdentifier();
     setRemainingRequests(rateLimiter.getRemainingRequests(clientId));
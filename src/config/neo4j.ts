@@ -1,5 +1,11 @@
 import neo4j, { Driver, Session } from 'neo4j-driver';
 
+// Connection settings are fixed at build time; read them once
+const NEO4J_URI = import.meta.env.VITE_NEO4J_URI;
+const NEO4J_USERNAME = import.meta.env.VITE_NEO4J_USERNAME;
+const NEO4J_PASSWORD = import.meta.env.VITE_NEO4J_PASSWORD;
+const NEO4J_DATABASE = import.meta.env.VITE_NEO4J_DATABASE;
+
 class Neo4jService {
   private driver: Driver | null = null;
   private isConnected: boolean = false;
@@ -10,9 +16,9 @@ class Neo4jService {
 
   private initializeDriver() {
     try {
-      const uri = import.meta.env.VITE_NEO4J_URI;
-      const username = import.meta.env.VITE_NEO4J_USERNAME;
-      const password = import.meta.env.VITE_NEO4J_PASSWORD;
+      const uri = NEO4J_URI;
+      const username = NEO4J_USERNAME;
+      const password = NEO4J_PASSWORD;
 
       console.log('🔧 Neo4j initialization:', {
         uri: uri ? `${uri.substring(0, 20)}...` : 'NOT SET',
@@ -39,7 +45,7 @@ class Neo4jService {
     if (!this.driver || !this.isConnected) {
       return null;
     }
-    return this.driver.session({ database: import.meta.env.VITE_NEO4J_DATABASE });
+    return this.driver.session({ database: NEO4J_DATABASE });
   }
 
   async testConnection(): Promise<boolean> {
@@ -58,12 +64,7 @@ class Neo4jService {
   }
 
   isConfigured(): boolean {
-    const configured = !!(
-      import.meta.env.VITE_NEO4J_URI &&
-      import.meta.env.VITE_NEO4J_USERNAME &&
-      import.meta.env.VITE_NEO4J_PASSWORD &&
-      import.meta.env.VITE_NEO4J_DATABASE
-    );
+    const configured = !!(NEO4J_URI && NEO4J_USERNAME && NEO4J_PASSWORD && NEO4J_DATABASE);
     
     console.log('🔍 Neo4j isConfigured():', {
       configured,
@@ -4,7 +4,15 @@ export const perplexityConfig = {
   apiUrl: import.meta.env.VITE_PERPLEXITY_API_URL || 'https://api.perplexity.ai/chat/completions',
   maxTokens: 1000,
   temperature: 0.1, // Low temperature for fact-checking accuracy
-  timeout: 30000 // 30 second timeout
+  timeout: 20000, // 20 second timeout per attempt (one retry on transient failures)
+  requestsPerMinute: 50, // Client-side pacing to stay under the API rate limit
+  burstLimit: 5,
+  maxConcurrentRequests: 4,
+  circuitFailureThreshold: 5, // Consecutive failed calls before failing fast
+  circuitCooldownMs: 30000,
+  cacheMaxEntries: 500,
+  cacheTtlMs: 60 * 60 * 1000, // Reuse verdicts for identical content for an hour
+  cacheRefreshAfterMs: 30 * 60 * 1000 // Past this age, serve the cached verdict but refresh it in the background
 };
 
 export const isPerplexityConfigured = (): boolean => {
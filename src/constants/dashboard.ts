@@ -0,0 +1,14 @@
+import { DashboardStats } from '../types';
+
+// Shared fallback when stats are unavailable
+export const EMPTY_DASHBOARD_STATS: Readonly<DashboardStats> = Object.freeze({
+  totalInteractions: 0,
+  flaggedInteractions: 0,
+  averageSeverity: 0,
+  topViolations: [],
+  agentActivity: []
+});
+
+// Object.freeze is shallow; freeze the arrays too so no caller can mutate the shared instance
+Object.freeze(EMPTY_DASHBOARD_STATS.topViolations);
+Object.freeze(EMPTY_DASHBOARD_STATS.agentActivity);
@@ -1,3 +1,5 @@
+import { parseRetryAfter, TransientError, withRetry } from '../utils/retry';
+
 interface OpenAIResponse {
   id: string;
   object: string;
@@ -25,22 +27,24 @@ interface LLMResult {
   error?: string;
 }
 
-export async function callOpenAI(prompt: string): Promise<LLMResult> {
-  const apiKey = import.meta.env.VITE_OPENAI_API_KEY;
-  
-  if (!apiKey) {
-    console.warn('OPENAI_API_KEY not found, using fallback');
-    return {
-      response: `Simulated OpenAI reply for: "${prompt}"`,
-      source: 'fallback',
-      error: 'API key not configured'
-    };
-  }
+function fallbackResult(prompt: string, error: string): LLMResult {
+  return {
+    response: `Simulated OpenAI reply for: "${prompt}"`,
+    source: 'fallback',
+    error
+  };
+}
 
-  try {
-    const controller = new AbortController();
-    const timeoutId = setTimeout(() => controller.abort(), 30000); // 30 second timeout
+// Non-retryable API errors come back as a value; only TransientError is thrown for withRetry
+type CompletionOutcome =
+  | { ok: true; data: OpenAIResponse }
+  | { ok: false; error: string };
+
+async function requestCompletion(apiKey: string, prompt: string): Promise<CompletionOutcome> {
+  const controller = new AbortController();
+  const timeoutId = setTimeout(() => controller.abort(), 30000); // 30 second timeout
 
+  try {
     const response = await fetch('https://api.openai.com/v1/chat/completions', {
       method: 'POST',
       headers: {
@@ -63,22 +67,49 @@ export async function callOpenAI(prompt: string): Promise<LLMResult> {
       signal: controller.signal
     });
 
-    clearTimeout(timeoutId);
-
     if (!response.ok) {
       const errorData = await response.json().catch(() => ({}));
-      throw new Error(`OpenAI API error: ${response.status} - ${errorData.error?.message || response.statusText}`);
+      const message = `OpenAI API error: ${response.status} - ${errorData.error?.message || response.statusText}`;
+      if (response.status === 429 || response.status >= 500) {
+        throw new TransientError(message, parseRetryAfter(response.headers.get('retry-after')));
+      }
+      return { ok: false, error: message };
     }
 
-    const data: OpenAIResponse = await response.json();
-    
-    if (!data.choices || data.choices.length === 0) {
-      throw new Error('No response choices returned from OpenAI API');
+    return { ok: true, data: await response.json() };
+  } catch (error) {
+    if (error instanceof Error && error.name === 'AbortError') {
+      throw new TransientError('OpenAI API request timed out');
     }
+    throw error;
+  } finally {
+    clearTimeout(timeoutId);
+  }
+}
+
+export async function callOpenAI(prompt: string): Promise<LLMResult> {
+  const apiKey = import.meta.env.VITE_OPENAI_API_KEY;
+  
+  if (!apiKey) {
+    console.warn('OPENAI_API_KEY not found, using fallback');
+    return fallbackResult(prompt, 'API key not configured');
+  }
+
+  try {
+    // Rate limits, 5xx responses and timeouts are retried with backoff (or the server's Retry-After)
+    const outcome = await withRetry(() => requestCompletion(apiKey, prompt), { attempts: 3 });
+    if (!outcome.ok) {
+      console.error('OpenAI API call failed:', outcome.error);
+      return fallbackResult(prompt, outcome.error);
+    }
+
+    const { data } = outcome;
+    const content = data.choices?.[0]?.message?.content;
 
-    const content = data.choices[0].message.content;
     if (!content) {
-      throw new Error('Empty response content from OpenAI API');
+      const error = data.choices?.length ? 'Empty response content from OpenAI API' : 'No response choices returned from OpenAI API';
+      console.error('OpenAI API call failed:', error);
+      return fallbackResult(prompt, error);
     }
 
     return {
@@ -88,14 +119,9 @@ export async function callOpenAI(prompt: string): Promise<LLMResult> {
     };
 
   } catch (error) {
+    // Network failures and rate limits, 5xx responses or timeouts that outlasted the retries
     console.error('OpenAI API call failed:', error);
-    
-    // Return fallback response
-    return {
-      response: `Simulated OpenAI reply for: "${prompt}"`,
-      source: 'fallback',
-      error: error instanceof Error ? error.message : 'Unknown error'
-    };
+    return fallbackResult(prompt, error instanceof Error ? error.message : 'Unknown error');
   }
 }
 
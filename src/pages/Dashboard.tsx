@@ -5,18 +5,13 @@ import StatsCard from '../components/StatsCard';
 import ViolationChart from '../components/ViolationChart';
 import { DashboardStats } from '../types';
 import { apiService } from '../api/apiService';
+import { EMPTY_DASHBOARD_STATS } from '../constants/dashboard';
 import EmptyState from '../components/EmptyState';
 import Graph from '../components/Graph';
 import { BarChart3 } from 'lucide-react';
 
 const Dashboard: React.FC = () => {
-  const [stats, setStats] = useState<DashboardStats>({
-    totalInteractions: 0,
-    flaggedInteractions: 0,
-    averageSeverity: 0,
-    topViolations: [],
-    agentActivity: []
-  });
+  const [stats, setStats] = useState<DashboardStats>(EMPTY_DASHBOARD_STATS);
 
   useEffect(() => {
     const fetchStats = async () => {
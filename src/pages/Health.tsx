@@ -36,12 +36,13 @@ const Health: React.FC = () => {
 
   const checkAllServices = async () => {
     const updatedServices: ServiceStatus[] = [];
+    // Every entry in one sweep shares the sweep's start time
+    const checkedAt = new Date();
 
     // Check Backend Server
     try {
-      const startTime = Date.now();
       const response = await fetch(API_URLS.health);
-      const responseTime = Date.now() - startTime;
+      const responseTime = Date.now() - checkedAt.getTime();
       
       if (response.ok) {
         const data = await response.json();
@@ -52,7 +53,7 @@ const Health: React.FC = () => {
           port: '3000',
           responseTime,
           details: `Status: ${data.status}`,
-          lastChecked: new Date(),
+          lastChecked: checkedAt,
         });
 
         // Update individual service statuses from backend health check
@@ -60,14 +61,14 @@ const Health: React.FC = () => {
           name: 'Neo4j Database',
           status: data.services?.neo4j ? 'healthy' : 'error',
           details: data.services?.neo4j ? 'Connected' : 'Not connected',
-          lastChecked: new Date(),
+          lastChecked: checkedAt,
         });
 
         updatedServices.push({
           name: 'LlamaIndex',
           status: data.services?.llamaIndex ? 'healthy' : 'error',
           details: data.services?.llamaIndex ? 'Configured' : 'Not configured',
-          lastChecked: new Date(),
+          lastChecked: checkedAt,
         });
 
         updatedServices.push({
@@ -75,7 +76,7 @@ const Health: React.FC = () => {
           status: data.services?.copilotKit ? 'healthy' : 'error',
           url: API_URLS.copilotkit,
           details: data.services?.copilotKit ? 'Active' : 'Inactive',
-          lastChecked: new Date(),
+          lastChecked: checkedAt,
         });
       } else {
         updatedServices.push({
@@ -84,7 +85,7 @@ const Health: React.FC = () => {
           url: API_CONFIG.BASE_URL,
           port: '3000',
           details: `HTTP ${response.status}`,
-          lastChecked: new Date(),
+          lastChecked: checkedAt,
         });
       }
     } catch (error) {
@@ -94,7 +95,7 @@ const Health: React.FC = () => {
         url: API_CONFIG.BASE_URL,
         port: '3000',
         details: error instanceof Error ? error.message : 'Connection failed',
-        lastChecked: new Date(),
+        lastChecked: checkedAt,
       });
     }
 
@@ -105,7 +106,7 @@ const Health: React.FC = () => {
       url: window.location.origin,
       port: '5173',
       details: 'Running (you are here)',
-      lastChecked: new Date(),
+      lastChecked: checkedAt,
     });
 
     // Check OpenAI API (indirect check via environment)
@@ -113,7 +114,7 @@ const Health: React.FC = () => {
       name: 'OpenAI API',
       status: import.meta.env.VITE_OPENAI_API_KEY ? 'healthy' : 'error',
       details: import.meta.env.VITE_OPENAI_API_KEY ? 'API key configured' : 'API key missing',
-      lastChecked: new Date(),
+      lastChecked: checkedAt,
     });
 
     // Check Perplexity API
@@ -121,7 +122,7 @@ const Health: React.FC = () => {
       name: 'Perplexity API',
       status: import.meta.env.VITE_PERPLEXITY_API_KEY ? 'healthy' : 'error',
       details: import.meta.env.VITE_PERPLEXITY_API_KEY ? 'API key configured' : 'API key missing',
-      lastChecked: new Date(),
+      lastChecked: checkedAt,
     });
 
     // Check Convex
@@ -130,7 +131,7 @@ const Health: React.FC = () => {
       status: import.meta.env.VITE_CONVEX_URL ? 'healthy' : 'error',
       url: import.meta.env.VITE_CONVEX_URL,
       details: import.meta.env.VITE_CONVEX_URL ? 'Configured' : 'Not configured',
-      lastChecked: new Date(),
+      lastChecked: checkedAt,
     });
 
     setServices(updatedServices);
@@ -1,6 +1,7 @@
 import { LLMInteraction } from '../types';
 import { agents } from '../agents';
 import { inkeepAgentsService } from './inkeepAgentsService';
+import { randomId } from '../utils/randomId';
 
 /**
  * Unified governance service that can use either legacy agents or Inkeep agents
@@ -33,7 +34,7 @@ export class GovernanceService {
    * Process an AI interaction through the governance system
    */
   async processInteraction(input: string, output: string, context?: any): Promise<LLMInteraction> {
-    const interactionId = `interaction_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+    const interactionId = `interaction_${randomId()}`;
     
     console.log(`🛡️ Processing interaction ${interactionId} with ${this.shouldUseInkeep() ? 'Inkeep' : 'legacy'} agents`);
 
@@ -182,14 +183,13 @@ export class GovernanceService {
       return;
     }
 
-    const maxSeverity = Math.max(...interaction.violations.map(v => v.severity));
-    const criticalViolations = interaction.violations.filter(v => v.severity >= 9);
-    const highViolations = interaction.violations.filter(v => v.severity >= 7);
+    // The thresholds below only depend on the highest severity, so one pass suffices
+    const maxSeverity = interaction.violations.reduce((max, v) => Math.max(max, v.severity), 0);
 
-    if (criticalViolations.length > 0) {
+    if (maxSeverity >= 9) {
       interaction.status = 'blocked';
       interaction.severity = 'critical';
-    } else if (highViolations.length > 0) {
+    } else if (maxSeverity >= 7) {
       interaction.status = 'pending';
       interaction.severity = 'high';
     } else if (maxSeverity >= 5) {
@@ -2,7 +2,8 @@ import { LLMInteraction, Violation } from '../types';
 import { agents } from '../agents';
 import { inkeepAgentsService } from './inkeepAgentsService';
 import supabaseService from './supabaseService';
-import { createAuditLog } from './supabaseService';
+import { enqueueAuditLog } from './supabaseService';
+import { randomId } from '../utils/randomId';
 /**
  * Enhanced governance service with Supabase integration
  * Provides real-time data persistence and analytics
@@ -43,8 +44,8 @@ export class GovernanceServiceSupabase {
    * Process an AI interaction through the governance system with Supabase persistence
    */
   async processInteraction(input: string, output: string, context?: any): Promise<LLMInteraction> {
-    const interactionId = `interaction_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
     const startTime = Date.now();
+    const interactionId = `interaction_${randomId()}`;
     
     console.log(`🛡️ Processing interaction ${interactionId} with ${this.shouldUseInkeep() ? 'Inkeep' : 'legacy'} agents`);
 
@@ -52,7 +53,7 @@ export class GovernanceServiceSupabase {
       id: interactionId,
       input,
       output,
-      timestamp: new Date(),
+      timestamp: new Date(startTime),
       status: 'pending',
       severity: 'low',
       violations: [],
@@ -60,21 +61,10 @@ export class GovernanceServiceSupabase {
     };
 
     try {
-      // Create interaction record in Supabase
+      // Create interaction record and log the start of processing in Supabase;
+      // audit logs are batched in the background, so only the record is awaited
       if (this.useSupabase) {
-        const agentId = context?.agentId || (await supabaseService.getAgents(true))[0]?.id;
-        
-        await supabaseService.createInteraction({
-          prompt: input,
-          response: output,
-          agent_id: agentId,
-          session_id: context?.sessionId || `session_${Date.now()}`,
-          compliance_status: 'pending',
-          metadata: { context }
-        });
-
-        // Log the start of processing
-        await createAuditLog({
+        void enqueueAuditLog({
           action: 'process_interaction_start',
           details: {
             interaction_id: interactionId,
@@ -83,6 +73,7 @@ export class GovernanceServiceSupabase {
           },
           level: 'info'
         });
+        await this.createPendingInteraction(input, output, context, startTime);
       }
 
       if (this.shouldUseInkeep()) {
@@ -95,7 +86,7 @@ export class GovernanceServiceSupabase {
       
       // Log error to Supabase
       if (this.useSupabase) {
-        await createAuditLog({
+        void enqueueAuditLog({
           action: 'process_interaction_error',
           details: {
             interaction_id: interactionId,
@@ -117,6 +108,27 @@ export class GovernanceServiceSupabase {
     }
   }
 
+  /**
+   * Create the pending interaction record in Supabase
+   */
+  private async createPendingInteraction(
+    input: string,
+    output: string,
+    context: any,
+    startTime: number
+  ): Promise<void> {
+    const agentId = context?.agentId || (await supabaseService.getAgents(true))[0]?.id;
+
+    await supabaseService.createInteraction({
+      prompt: input,
+      response: output,
+      agent_id: agentId,
+      session_id: context?.sessionId || `session_${startTime}`,
+      compliance_status: 'pending',
+      metadata: { context }
+    });
+  }
+
   /**
    * Process with Inkeep agents
    */
@@ -140,9 +152,7 @@ export class GovernanceServiceSupabase {
 
       // Store violations in Supabase
       if (this.useSupabase && result.violations.length > 0) {
-        for (const violation of result.violations) {
-          await this.persistViolation(interaction.id, violation);
-        }
+        await this.persistViolations(interaction.id, result.violations);
       }
 
       return interaction;
@@ -158,6 +168,11 @@ export class GovernanceServiceSupabase {
   private async processWithLegacyAgents(
     interaction: LLMInteraction
   ): Promise<LLMInteraction> {
+    // Resolve agent ids once for every agent's audit log instead of scanning per agent
+    const agentIdsByName = this.useSupabase
+      ? supabaseService.getAgents().then(records => new Map(records.map(a => [a.name, a.id])))
+      : null;
+
     const agentPromises = agents.map(async (agent) => {
       try {
         const action = await agent.process(interaction);
@@ -165,10 +180,9 @@ export class GovernanceServiceSupabase {
 
         // Log agent action to Supabase
         if (this.useSupabase) {
-          const agentRecord = await supabaseService.getAgents();
-          const agentId = agentRecord.find(a => a.name === agent.name)?.id;
+          const agentId = (await agentIdsByName)?.get(agent.name);
           
-          await createAuditLog({
+          void enqueueAuditLog({
             agent_id: agentId,
             action: `agent_${agent.type}_processed`,
             details: {
@@ -183,7 +197,7 @@ export class GovernanceServiceSupabase {
 
         if (action.type === 'violation') {
           const violation: Violation = {
-            id: `v_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`,
+            id: `v_${randomId()}`,
             policyId: action.policyId || 'unknown',
             description: action.reason,
             timestamp: new Date(),
@@ -245,7 +259,7 @@ export class GovernanceServiceSupabase {
       });
 
       // Log completion
-      await createAuditLog({
+      void enqueueAuditLog({
         action: 'process_interaction_complete',
         details: {
           interaction_id: interaction.id,
@@ -266,32 +280,48 @@ export class GovernanceServiceSupabase {
   private async persistViolation(
     interactionId: string,
     violation: Violation
+  ): Promise<void> {
+    await this.persistViolations(interactionId, [violation]);
+  }
+
+  /**
+   * Persist a batch of violations to Supabase, resolving policies and agents once
+   * for the whole batch and inserting every row in a single request
+   */
+  private async persistViolations(
+    interactionId: string,
+    violations: Violation[]
   ): Promise<void> {
     try {
-      // Get policy ID from Supabase
-      const policies = await supabaseService.getPolicies();
-      const policy = policies.find(p => p.id === violation.policyId) || policies[0];
+      const [policies, agentRecords] = await Promise.all([
+        supabaseService.getPolicies(),
+        supabaseService.getAgents()
+      ]);
 
-      if (!policy) {
+      if (policies.length === 0) {
         console.warn('No policies found in database');
         return;
       }
 
       // Get verifier agent
-      const agents = await supabaseService.getAgents();
-      const verifierAgent = agents.find(a => a.type === 'verifier');
-
-      await supabaseService.createViolation({
-        interaction_id: interactionId,
-        policy_id: policy.id,
-        severity: violation.severity,
-        description: violation.description,
-        detected_by_agent_id: verifierAgent?.id,
-        metadata: {
-          timestamp: violation.timestamp,
-          resolved: violation.resolved
-        }
-      });
+      const verifierAgent = agentRecords.find(a => a.type === 'verifier');
+      const policiesById = new Map(policies.map(p => [p.id, p]));
+
+      await supabaseService.createViolations(violations.map(violation => {
+        const policy = policiesById.get(violation.policyId) || policies[0];
+
+        return {
+          interaction_id: interactionId,
+          policy_id: policy.id,
+          severity: violation.severity,
+          description: violation.description,
+          detected_by_agent_id: verifierAgent?.id,
+          metadata: {
+            timestamp: violation.timestamp,
+            resolved: violation.resolved
+          }
+        };
+      }));
     } catch (error) {
       console.error('Error persisting violation:', error);
     }
@@ -338,10 +368,14 @@ export class GovernanceServiceSupabase {
    * Get maximum severity from a list
    */
   private getMaxSeverity(severities: string[]): 'low' | 'medium' | 'high' | 'critical' {
-    if (severities.includes('critical')) return 'critical';
-    if (severities.includes('high')) return 'high';
-    if (severities.includes('medium')) return 'medium';
-    return 'low';
+    // One pass, stopping as soon as the top level is seen
+    let max: 'low' | 'medium' | 'high' | 'critical' = 'low';
+    for (const severity of severities) {
+      if (severity === 'critical') return 'critical';
+      if (severity === 'high') max = 'high';
+      else if (severity === 'medium' && max === 'low') max = 'medium';
+    }
+    return max;
   }
 
   /**
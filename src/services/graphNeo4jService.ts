@@ -1,4 +1,6 @@
 import { neo4jService } from '../config/neo4j';
+import { randomId } from '../utils/randomId';
+import { EMPTY_DASHBOARD_STATS } from '../constants/dashboard';
 import { 
   LLMInteraction, 
   AuditLogEntry, 
@@ -7,10 +9,20 @@ import {
   DashboardStats
 } from '../types';
 
+// Graph visualization colors per node label
+const NODE_COLORS: Record<string, string> = {
+  'Interaction': '#4A90E2',
+  'Violation': '#E74C3C',
+  'AgentAction': '#2ECC71',
+  'UserFeedback': '#F39C12',
+  'AuditLog': '#9B59B6'
+};
+const DEFAULT_NODE_COLOR = '#95A5A6';
+
 export class GraphNeo4jService {
   // Helper method to generate unique IDs
   private generateId(): string {
-    return Date.now().toString(36) + Math.random().toString(36).substr(2);
+    return randomId();
   }
 
   // Helper method to convert Date to ISO string for Neo4j
@@ -109,72 +121,66 @@ export class GraphNeo4jService {
         llmError: interaction.llmError || null
       });
 
-      // Create violation nodes and relationships
-      for (const violation of interaction.violations) {
-        const violationId = this.generateId();
+      // Create violation nodes and relationships in a single round trip
+      if (interaction.violations.length > 0) {
         await session.run(`
+          MATCH (i:Interaction {id: $interactionId})
+          UNWIND $violations AS violation
           CREATE (v:Violation {
-            id: $violationId,
-            type: $type,
-            description: $description,
-            severity: $severity,
-            confidence: $confidence,
-            reason: $reason,
-            location: $location,
-            regulatoryFramework: $regulatoryFramework,
-            complianceLevel: $complianceLevel
+            id: violation.id,
+            type: violation.type,
+            description: violation.description,
+            severity: violation.severity,
+            confidence: violation.confidence,
+            reason: violation.reason,
+            location: violation.location,
+            regulatoryFramework: violation.regulatoryFramework,
+            complianceLevel: violation.complianceLevel
           })
-          WITH v
-          MATCH (i:Interaction {id: $interactionId})
           CREATE (i)-[:HAS_VIOLATION]->(v)
         `, {
-          violationId,
-          type: violation.type,
-          description: violation.description,
-          severity: violation.severity,
-          confidence: violation.confidence,
-          reason: violation.reason,
-          location: violation.location || null,
-          regulatoryFramework: violation.regulatoryFramework || null,
-          complianceLevel: violation.complianceLevel || null,
-          interactionId: id
+          interactionId: id,
+          violations: interaction.violations.map(violation => ({
+            id: this.generateId(),
+            type: violation.type,
+            description: violation.description,
+            severity: violation.severity,
+            confidence: violation.confidence,
+            reason: violation.reason,
+            location: violation.location || null,
+            regulatoryFramework: violation.regulatoryFramework || null,
+            complianceLevel: violation.complianceLevel || null
+          }))
         });
       }
 
-      // Create agent action nodes and relationships
-      for (const agentAction of interaction.agentActions) {
-        const actionId = this.generateId();
+      // Create agent action nodes and relationships, linking each action to
+      // every violation of this interaction
+      if (interaction.agentActions.length > 0) {
         await session.run(`
+          MATCH (i:Interaction {id: $interactionId})
+          OPTIONAL MATCH (i)-[:HAS_VIOLATION]->(v:Violation)
+          WITH i, collect(v) AS violations
+          UNWIND $agentActions AS agentAction
           CREATE (a:AgentAction {
-            id: $actionId,
-            agentName: $agentName,
-            action: $action,
-            details: $details,
-            timestamp: $timestamp
+            id: agentAction.id,
+            agentName: agentAction.agentName,
+            action: agentAction.action,
+            details: agentAction.details,
+            timestamp: agentAction.timestamp
           })
-          WITH a
-          MATCH (i:Interaction {id: $interactionId})
           CREATE (i)-[:PROCESSED_BY]->(a)
+          FOREACH (v IN violations | CREATE (v)-[:TRIGGERED_ACTION]->(a))
         `, {
-          actionId,
-          agentName: agentAction.agentName,
-          action: agentAction.action,
-          details: agentAction.details,
-          timestamp: this.dateToString(agentAction.timestamp),
-          interactionId: id
+          interactionId: id,
+          agentActions: interaction.agentActions.map(agentAction => ({
+            id: this.generateId(),
+            agentName: agentAction.agentName,
+            action: agentAction.action,
+            details: agentAction.details,
+            timestamp: this.dateToString(agentAction.timestamp)
+          }))
         });
-
-        // Create relationships between violations and agent actions
-        if (interaction.violations.length > 0) {
-          await session.run(`
-            MATCH (i:Interaction {id: $interactionId})-[:HAS_VIOLATION]->(v:Violation)
-            MATCH (i)-[:PROCESSED_BY]->(a:AgentAction {id: $actionId})
-            CREATE (v)-[:TRIGGERED_ACTION]->(a)
-          `, {
-            interactionId: id,
-            actionId
-          });
-        }
       }
 
       // Create user feedback node and relationship if exists
@@ -229,18 +235,14 @@ export class GraphNeo4jService {
 
       return result.records.map(record => {
         const interaction = record.get('i').properties;
-        const violations = record.get('violations').map((v: any) => v?.properties).filter(Boolean);
-        const agentActions = record.get('agentActions').map((a: any) => a?.properties).filter(Boolean);
         const userFeedback = record.get('userFeedback')?.properties;
-        
-        return {
-          id: interaction.id,
-          timestamp: this.stringToDate(interaction.timestamp),
-          input: interaction.input,
-          output: interaction.output,
-          status: interaction.status,
-          severity: interaction.severity,
-          violations: violations.map((v: any) => ({
+
+        // Unwrap and reshape the collected nodes in one pass each
+        const violations: LLMInteraction['violations'] = [];
+        for (const node of record.get('violations')) {
+          if (!node) continue;
+          const v = node.properties;
+          violations.push({
             type: v.type,
             description: v.description,
             severity: v.severity,
@@ -249,13 +251,30 @@ export class GraphNeo4jService {
             location: v.location,
             regulatoryFramework: v.regulatoryFramework,
             complianceLevel: v.complianceLevel
-          })),
-          agentActions: agentActions.map((a: any) => ({
+          });
+        }
+
+        const agentActions: LLMInteraction['agentActions'] = [];
+        for (const node of record.get('agentActions')) {
+          if (!node) continue;
+          const a = node.properties;
+          agentActions.push({
             agentName: a.agentName,
             action: a.action,
             details: a.details,
             timestamp: this.stringToDate(a.timestamp)
-          })),
+          });
+        }
+        
+        return {
+          id: interaction.id,
+          timestamp: this.stringToDate(interaction.timestamp),
+          input: interaction.input,
+          output: interaction.output,
+          status: interaction.status,
+          severity: interaction.severity,
+          violations,
+          agentActions,
           userFeedback: userFeedback ? {
             rating: userFeedback.rating,
             comment: userFeedback.comment,
@@ -286,10 +305,10 @@ export class GraphNeo4jService {
         RETURN n, labels(n)[0] as type, id(n) as nodeId
       `);
 
+      // Unpack each record in one go rather than a keyed lookup per field
       const nodes = nodesResult.records.map(record => {
-        const node = record.get('n').properties;
-        const type = record.get('type');
-        const nodeId = record.get('nodeId');
+        const { n, type, nodeId } = record.toObject();
+        const node = n.properties;
         
         return {
           id: nodeId.toString(), // Convert Neo4j Integer to string
@@ -307,12 +326,15 @@ export class GraphNeo4jService {
         RETURN id(a) as sourceId, id(b) as targetId, type(r) as relType, r as relationship
       `);
 
-      const links = linksResult.records.map(record => ({
-        source: record.get('sourceId').toString(), // Convert Neo4j Integer to string
-        target: record.get('targetId').toString(), // Convert Neo4j Integer to string
-        type: record.get('relType'),
-        properties: record.get('relationship').properties
-      }));
+      const links = linksResult.records.map(record => {
+        const { sourceId, targetId, relType, relationship } = record.toObject();
+        return {
+          source: sourceId.toString(), // Convert Neo4j Integer to string
+          target: targetId.toString(), // Convert Neo4j Integer to string
+          type: relType,
+          properties: relationship.properties
+        };
+      });
 
       return { nodes, links };
     } catch (error) {
@@ -324,14 +346,7 @@ export class GraphNeo4jService {
   }
 
   private getNodeColor(type: string): string {
-    const colors = {
-      'Interaction': '#4A90E2',
-      'Violation': '#E74C3C',
-      'AgentAction': '#2ECC71',
-      'UserFeedback': '#F39C12',
-      'AuditLog': '#9B59B6'
-    };
-    return colors[type as keyof typeof colors] || '#95A5A6';
+    return NODE_COLORS[type] || DEFAULT_NODE_COLOR;
   }
 
   private getNodeSize(type: string, properties: any): number {
@@ -382,6 +397,50 @@ export class GraphNeo4jService {
     }
   }
 
+  // Save several audit logs in one round trip
+  async saveAuditLogs(auditLogs: AuditLogEntry[]): Promise<string[]> {
+    if (auditLogs.length === 0) return [];
+
+    const session = neo4jService.getSession();
+    if (!session) throw new Error('Neo4j not configured');
+
+    try {
+      const logs = auditLogs.map(auditLog => ({
+        id: auditLog.id || this.generateId(),
+        timestamp: this.dateToString(auditLog.timestamp),
+        agentName: auditLog.agentName,
+        action: auditLog.action,
+        violationType: auditLog.violationType || null,
+        severity: auditLog.severity || null,
+        details: auditLog.details,
+        interactionId: auditLog.interactionId
+      }));
+
+      await session.run(`
+        UNWIND $logs AS log
+        CREATE (al:AuditLog {
+          id: log.id,
+          timestamp: log.timestamp,
+          agentName: log.agentName,
+          action: log.action,
+          violationType: log.violationType,
+          severity: log.severity,
+          details: log.details
+        })
+        WITH al, log
+        MATCH (i:Interaction {id: log.interactionId})
+        CREATE (al)-[:AUDITS]->(i)
+      `, { logs });
+
+      return logs.map(log => log.id);
+    } catch (error) {
+      console.error('Error saving audit logs:', error);
+      throw error;
+    } finally {
+      await session.close();
+    }
+  }
+
   // Get audit logs with relationships
   async getAuditLogs(limitCount: number = 50): Promise<AuditLogEntry[]> {
     const session = neo4jService.getSession();
@@ -544,53 +603,51 @@ export class GraphNeo4jService {
 
   // Get dashboard stats using graph queries
   async getDashboardStats(): Promise<DashboardStats> {
-    const session = neo4jService.getSession();
-    if (!session) {
-      return {
-        totalInteractions: 0,
-        flaggedInteractions: 0,
-        averageSeverity: 0,
-        topViolations: [],
-        agentActivity: []
-      };
+    const statsSession = neo4jService.getSession();
+    if (!statsSession) {
+      return EMPTY_DASHBOARD_STATS;
     }
+    // The three aggregates are independent, but a session runs one query at a time,
+    // so each gets its own session and they run concurrently
+    const violationsSession = neo4jService.getSession()!;
+    const agentSession = neo4jService.getSession()!;
 
     try {
-      // Get total interactions and flagged interactions
-      const statsResult = await session.run(`
-        MATCH (i:Interaction)
-        OPTIONAL MATCH (i)-[:HAS_VIOLATION]->(v:Violation)
-        RETURN 
-          count(DISTINCT i) as totalInteractions,
-          count(DISTINCT CASE WHEN v IS NOT NULL THEN i END) as flaggedInteractions,
-          avg(CASE WHEN v IS NOT NULL THEN v.severity END) as avgSeverity
-      `);
+      const [statsResult, violationsResult, agentResult] = await Promise.all([
+        // Get total interactions and flagged interactions
+        statsSession.run(`
+          MATCH (i:Interaction)
+          OPTIONAL MATCH (i)-[:HAS_VIOLATION]->(v:Violation)
+          RETURN 
+            count(DISTINCT i) as totalInteractions,
+            count(DISTINCT CASE WHEN v IS NOT NULL THEN i END) as flaggedInteractions,
+            avg(CASE WHEN v IS NOT NULL THEN v.severity END) as avgSeverity
+        `),
+        // Get top violations
+        violationsSession.run(`
+          MATCH (v:Violation)
+          RETURN v.type as type, count(v) as count
+          ORDER BY count DESC
+          LIMIT 5
+        `),
+        // Get agent activity
+        agentSession.run(`
+          MATCH (a:AgentAction)
+          RETURN a.agentName as agent, count(a) as actions
+          ORDER BY actions DESC
+        `)
+      ]);
 
       const stats = statsResult.records[0];
       const totalInteractions = stats.get('totalInteractions').toNumber();
       const flaggedInteractions = stats.get('flaggedInteractions').toNumber();
       const averageSeverity = stats.get('avgSeverity') || 0;
 
-      // Get top violations
-      const violationsResult = await session.run(`
-        MATCH (v:Violation)
-        RETURN v.type as type, count(v) as count
-        ORDER BY count DESC
-        LIMIT 5
-      `);
-
       const topViolations = violationsResult.records.map(record => ({
         type: record.get('type'),
         count: record.get('count').toNumber()
       }));
 
-      // Get agent activity
-      const agentResult = await session.run(`
-        MATCH (a:AgentAction)
-        RETURN a.agentName as agent, count(a) as actions
-        ORDER BY actions DESC
-      `);
-
       const agentActivity = agentResult.records.map(record => ({
         agent: record.get('agent'),
         actions: record.get('actions').toNumber()
@@ -605,15 +662,9 @@ export class GraphNeo4jService {
       };
     } catch (error) {
       console.error('Error fetching dashboard stats:', error);
-      return {
-        totalInteractions: 0,
-        flaggedInteractions: 0,
-        averageSeverity: 0,
-        topViolations: [],
-        agentActivity: []
-      };
+      return EMPTY_DASHBOARD_STATS;
     } finally {
-      await session.close();
+      await Promise.all([statsSession.close(), violationsSession.close(), agentSession.close()]);
     }
   }
 }
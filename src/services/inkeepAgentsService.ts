@@ -1,4 +1,48 @@
 import { AgentAction, Violation } from '../types';
+import { parseRetryAfter, TransientError, withRetry } from '../utils/retry';
+import { SingleFlight } from '../utils/singleFlight';
+import { TtlCache } from '../utils/ttlCache';
+
+const HEALTH_CHECK_TIMEOUT_MS = 5000;
+const REQUEST_TIMEOUT_MS = 30000;
+const INSIGHTS_CACHE_TTL_MS = 5 * 60 * 1000;
+
+// Static instruction blocks for the agent prompts, built once; only the interaction details vary per call
+const BASIC_GOVERNANCE_INSTRUCTIONS = `Please provide a comprehensive governance analysis including:
+1. Any policy violations detected
+2. Severity assessment
+3. Recommended actions
+4. Compliance status`;
+
+const ADVANCED_GOVERNANCE_INSTRUCTIONS = `Please provide:
+1. Comprehensive policy violation analysis across all regulatory frameworks
+2. Content verification and fact-checking
+3. Risk assessment and impact analysis
+4. Safe alternative responses if violations found
+5. Detailed audit trail information`;
+
+const FEEDBACK_INSTRUCTIONS = `Please:
+1. Analyze the feedback for governance insights
+2. Create appropriate audit log entries
+3. Identify any system improvement opportunities
+4. Generate compliance reports if needed`;
+
+const INSIGHTS_INSTRUCTIONS = `Please include:
+1. Overall interaction and violation statistics
+2. Compliance status across regulatory frameworks
+3. Top violation types and trends
+4. Risk assessment summary
+5. Recommendations for improvement`;
+
+export interface GovernanceInsights {
+  totalInteractions: number;
+  totalViolations: number;
+  blockedCount: number;
+  approvalRate: string;
+  topViolationTypes: string[];
+  complianceStatus: any;
+  trends: any;
+}
 
 /**
  * Service for integrating with Inkeep EthosLens agents
@@ -8,6 +52,9 @@ export class InkeepAgentsService {
   private static instance: InkeepAgentsService;
   private baseUrl: string;
   private isEnabled: boolean;
+  // Insights are an aggregate over a timeframe; reuse a recent answer instead of re-running the agent graph
+  private insightsCache = new TtlCache<GovernanceInsights>(50, INSIGHTS_CACHE_TTL_MS);
+  private insightsInflight = new SingleFlight<GovernanceInsights>();
 
   constructor() {
     // Inkeep agents run API URL (from the my-agent-directory configuration)
@@ -31,9 +78,10 @@ export class InkeepAgentsService {
     }
 
     try {
+      // fetch has no timeout option; abort a hung health check instead of stalling startup
       const response = await fetch(`${this.baseUrl}/health`, {
         method: 'GET',
-        timeout: 5000
+        signal: AbortSignal.timeout(HEALTH_CHECK_TIMEOUT_MS)
       });
       return response.ok;
     } catch (error) {
@@ -52,31 +100,12 @@ export class InkeepAgentsService {
     severity: 'low' | 'medium' | 'high' | 'critical';
   }> {
     try {
-      const response = await fetch(`${this.baseUrl}/conversations`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          graphId: 'governance-graph-basic',
-          message: `Please analyze this AI interaction for policy violations:
+      const result = await this.postConversation('governance-graph-basic', `Please analyze this AI interaction for policy violations:
 
 Input: "${input}"
 Output: "${output}"
 
-Please provide a comprehensive governance analysis including:
-1. Any policy violations detected
-2. Severity assessment
-3. Recommended actions
-4. Compliance status`
-        })
-      });
-
-      if (!response.ok) {
-        throw new Error(`Inkeep agents API error: ${response.status}`);
-      }
-
-      const result = await response.json();
+${BASIC_GOVERNANCE_INSTRUCTIONS}`);
       return this.parseGovernanceResponse(result);
     } catch (error) {
       console.error('Error processing basic governance:', error);
@@ -96,33 +125,13 @@ Please provide a comprehensive governance analysis including:
     riskAssessment?: any;
   }> {
     try {
-      const response = await fetch(`${this.baseUrl}/conversations`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          graphId: 'governance-graph-advanced',
-          message: `Please perform advanced governance analysis on this AI interaction:
+      const result = await this.postConversation('governance-graph-advanced', `Please perform advanced governance analysis on this AI interaction:
 
 Input: "${input}"
 Output: "${output}"
 ${context ? `Context: ${JSON.stringify(context)}` : ''}
 
-Please provide:
-1. Comprehensive policy violation analysis across all regulatory frameworks
-2. Content verification and fact-checking
-3. Risk assessment and impact analysis
-4. Safe alternative responses if violations found
-5. Detailed audit trail information`
-        })
-      });
-
-      if (!response.ok) {
-        throw new Error(`Inkeep agents API error: ${response.status}`);
-      }
-
-      const result = await response.json();
+${ADVANCED_GOVERNANCE_INSTRUCTIONS}`);
       return this.parseAdvancedGovernanceResponse(result);
     } catch (error) {
       console.error('Error processing advanced governance:', error);
@@ -142,31 +151,12 @@ Please provide:
     improvementRecommendations?: string[];
   }> {
     try {
-      const response = await fetch(`${this.baseUrl}/conversations`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          graphId: 'compliance-audit-graph',
-          message: `Please process user feedback for interaction ${interactionId}:
+      await this.postConversation('compliance-audit-graph', `Please process user feedback for interaction ${interactionId}:
 
 Feedback Type: ${feedback.rating}
 ${feedback.comment ? `Comment: "${feedback.comment}"` : ''}
 
-Please:
-1. Analyze the feedback for governance insights
-2. Create appropriate audit log entries
-3. Identify any system improvement opportunities
-4. Generate compliance reports if needed`
-        })
-      });
-
-      if (!response.ok) {
-        throw new Error(`Inkeep agents API error: ${response.status}`);
-      }
-
-      await response.json(); // Result available but not currently used for parsing
+${FEEDBACK_INSTRUCTIONS}`); // Result available but not currently used for parsing
       return this.parseFeedbackResponse();
     } catch (error) {
       console.error('Error processing feedback:', error);
@@ -177,44 +167,65 @@ Please:
   /**
    * Get governance insights and analytics
    */
-  async getGovernanceInsights(timeframe: string = 'today'): Promise<{
-    totalInteractions: number;
-    totalViolations: number;
-    blockedCount: number;
-    approvalRate: string;
-    topViolationTypes: string[];
-    complianceStatus: any;
-    trends: any;
-  }> {
-    try {
+  async getGovernanceInsights(timeframe: string = 'today'): Promise<GovernanceInsights> {
+    const cacheKey = timeframe.trim().toLowerCase();
+    const cached = this.insightsCache.get(cacheKey);
+    if (cached) {
+      return cached;
+    }
+
+    // Concurrent dashboard loads for the same timeframe share one agent run
+    return this.insightsInflight.do(cacheKey, async () => {
+      try {
+        await this.postConversation('compliance-audit-graph', `Please provide governance insights and analytics for the ${timeframe} timeframe:
+
+${INSIGHTS_INSTRUCTIONS}`); // Result available but not currently used for parsing
+        const insights = this.parseInsightsResponse();
+        this.insightsCache.set(cacheKey, insights);
+        return insights;
+      } catch (error) {
+        console.error('Error getting governance insights:', error);
+        throw error;
+      }
+    });
+  }
+
+  /**
+   * Send a message to an Inkeep agent graph. Conversations are not idempotent (the
+   * audit graph records entries), so only failures where the request was never
+   * processed are retried: 429, 503 and connection errors. Timeouts and other 5xx
+   * responses may have been handled server-side and are surfaced instead.
+   */
+  private async postConversation(graphId: string, message: string): Promise<any> {
+    return withRetry(async () => {
       const response = await fetch(`${this.baseUrl}/conversations`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
-        body: JSON.stringify({
-          graphId: 'compliance-audit-graph',
-          message: `Please provide governance insights and analytics for the ${timeframe} timeframe:
-
-Please include:
-1. Overall interaction and violation statistics
-2. Compliance status across regulatory frameworks
-3. Top violation types and trends
-4. Risk assessment summary
-5. Recommendations for improvement`
-        })
+        body: JSON.stringify({ graphId, message }),
+        signal: AbortSignal.timeout(REQUEST_TIMEOUT_MS)
+      }).catch(error => {
+        if (error instanceof Error && error.name === 'TimeoutError') {
+          throw new Error(`Inkeep agents API request timed out after ${REQUEST_TIMEOUT_MS}ms`);
+        }
+        // fetch rejects with a TypeError when the connection could not be made
+        if (error instanceof TypeError) {
+          throw new TransientError(`Inkeep agents API unreachable: ${error.message}`);
+        }
+        throw error;
       });
 
       if (!response.ok) {
-        throw new Error(`Inkeep agents API error: ${response.status}`);
+        const errorMessage = `Inkeep agents API error: ${response.status}`;
+        if (response.status === 429 || response.status === 503) {
+          throw new TransientError(errorMessage, parseRetryAfter(response.headers.get('retry-after')));
+        }
+        throw new Error(errorMessage);
       }
 
-      await response.json(); // Result available but not currently used for parsing
-      return this.parseInsightsResponse();
-    } catch (error) {
-      console.error('Error getting governance insights:', error);
-      throw error;
-    }
+      return response.json();
+    }, { attempts: 3 });
   }
 
   /**
@@ -233,17 +244,19 @@ Please include:
     const violations: Violation[] = [];
     const agentActions: AgentAction[] = [];
     
-    // Extract violations from response (simplified pattern matching)
-    if (content.toLowerCase().includes('violation') || content.toLowerCase().includes('blocked')) {
+    // Extract violations from response (simplified pattern matching); lowercase the reply once
+    const contentLower = content.toLowerCase();
+    if (contentLower.includes('violation') || contentLower.includes('blocked')) {
+      const isCritical = contentLower.includes('critical');
       violations.push({
         type: 'compliance',
         description: 'Policy violation detected by Inkeep agents',
-        severity: content.toLowerCase().includes('critical') ? 9 : 
-                 content.toLowerCase().includes('high') ? 7 : 5,
+        severity: isCritical ? 9 : 
+                 contentLower.includes('high') ? 7 : 5,
         confidence: 0.85,
         reason: 'Detected through Inkeep governance analysis',
         regulatoryFramework: 'Multiple frameworks',
-        complianceLevel: content.toLowerCase().includes('critical') ? 'critical' : 'high'
+        complianceLevel: isCritical ? 'critical' : 'high'
       });
     }
 
@@ -251,7 +264,7 @@ Please include:
     agentActions.push({
       agentName: 'InkeepGovernanceCoordinator',
       action: violations.length > 0 ? 'flag' : 'approve',
-      details: content.substring(0, 200) + '...',
+      details: content.length > 200 ? `${content.substring(0, 200)}...` : content,
       timestamp: new Date()
     });
 
@@ -331,15 +344,7 @@ Please include:
   /**
    * Parse governance insights response
    */
-  private parseInsightsResponse(/* _response: any */): {
-    totalInteractions: number;
-    totalViolations: number;
-    blockedCount: number;
-    approvalRate: string;
-    topViolationTypes: string[];
-    complianceStatus: any;
-    trends: any;
-  } {
+  private parseInsightsResponse(/* _response: any */): GovernanceInsights {
     // Response content available but not currently used for parsing
     // const content = response.content || response.message || '';
     
@@ -1,4 +1,129 @@
 import { perplexityConfig } from '../config/perplexity';
+import { CircuitBreaker } from '../utils/circuitBreaker';
+import { Semaphore } from '../utils/concurrency';
+import { parseRetryAfter, TransientError, withRetry } from '../utils/retry';
+import { SingleFlight } from '../utils/singleFlight';
+import { TokenBucket } from '../utils/tokenBucket';
+import { TtlCache } from '../utils/ttlCache';
+
+// Response heuristics, compiled once; none use the g flag, so sharing them keeps no lastIndex state
+const KNOWN_FALSE_CLAIM_REGEX = /(?:elon musk|taylor swift|jeff bezos|mark zuckerberg).*nobel peace prize/i;
+const STATED_FALSE_CLAIM_REGEX = /(?:elon musk|taylor swift).*nobel peace prize/i;
+const FALSE_CLAIM_DENIAL_REGEX = /(?:elon musk|taylor swift).*never.*nobel/i;
+
+const INACCURATE_INDICATORS = [
+  'false', 'incorrect', 'inaccurate', 'misleading', 'misinformation',
+  'not true', 'fabricated', 'unverified', 'disputed', 'debunked',
+  'never won', 'never received', 'did not win', 'has not won',
+  'no evidence', 'no record', 'unfounded', 'baseless'
+];
+
+const ACCURATE_INDICATORS = [
+  'accurate', 'correct', 'true', 'verified', 'confirmed',
+  'supported by evidence', 'factual', 'reliable', 'documented'
+];
+
+// Checked in order; the first phrase found sets the confidence
+const CONFIDENCE_PHRASES: ReadonlyArray<[string, number]> = [
+  ['very confident', 0.9],
+  ['highly confident', 0.9],
+  ['definitely false', 0.95],
+  ['clearly false', 0.9],
+  ['obviously false', 0.9],
+  ['confident', 0.8],
+  ['likely', 0.7],
+  ['probably', 0.6],
+  ['possibly', 0.5],
+  ['uncertain', 0.4],
+  ['unlikely', 0.3],
+  ['doubtful', 0.2],
+  ['never won', 0.9], // High confidence when stating someone never won something
+  ['no evidence', 0.85],
+  ['no record', 0.85]
+];
+
+// Static prompt text, built once; only the content under review varies per call
+const SYSTEM_PROMPT = 'You are a fact-checking assistant. Analyze the provided content for accuracy and provide a structured response with verification status, confidence level, and reasoning.';
+
+const VERIFICATION_PROMPT_HEADER = `You are a fact-checking expert. Analyze the following content for factual accuracy. Be especially critical of claims that seem unlikely or extraordinary.
+
+Content to verify:
+`;
+
+const VERIFICATION_PROMPT_INSTRUCTIONS = `
+
+IMPORTANT: If the content contains false information, misinformation, or claims that are not supported by evidence, set "isAccurate" to false and provide a high confidence score (0.8-0.95) in your assessment.
+
+Examples of false claims to flag:
+- Celebrities winning awards they never received (e.g., "Elon Musk won a Nobel Peace Prize")
+- Historical events that never happened
+- Scientific claims that contradict established knowledge
+- Medical misinformation
+
+Respond in JSON format:
+{
+  "isAccurate": true/false,
+  "confidence": 0.0-1.0 (how confident you are in your assessment),
+  "summary": "Brief explanation of verification result",
+  "reasoning": "Detailed reasoning for the assessment",
+  "sources": ["list of relevant sources if available"]
+}
+
+Evaluation criteria:
+1. Factual accuracy of claims made
+2. Cross-reference with reliable sources and established facts
+3. Flag extraordinary claims that lack evidence
+4. Be skeptical of claims that seem too good to be true
+5. Check for common misinformation patterns
+
+If you find the content contains false information, be confident in marking it as inaccurate.`;
+
+const FACT_CHECK_PROMPT_HEADER = `You are a professional fact-checker. Analyze this claim with high scrutiny and skepticism.
+
+Claim to fact-check:
+`;
+
+const FACT_CHECK_PROMPT_INSTRUCTIONS = `
+
+CRITICAL: If this claim is false or misleading, you must set "isAccurate" to false with high confidence (0.85-0.95).
+
+Common false claims to watch for:
+- Nobel Prize winners who never won (especially celebrities like Elon Musk, Taylor Swift, etc.)
+- Historical events that never occurred
+- Scientific "facts" that are actually myths
+- Celebrity achievements that are fabricated
+
+Respond in JSON format:
+{
+  "isAccurate": true/false,
+  "confidence": 0.0-1.0 (confidence in your fact-check assessment),
+  "summary": "Brief fact-check result",
+  "reasoning": "Detailed explanation with evidence",
+  "sources": ["relevant sources that support or refute the claim"]
+}
+
+Fact-checking process:
+1. Whether the claim is factually correct
+2. Search for contradicting evidence
+3. Verify against authoritative sources
+4. Consider the plausibility of the claim
+5. Check for common misinformation patterns
+
+Be confident in your assessment - if something is clearly false, mark it as such with high confidence.`;
+
+// One budget for every outbound Perplexity call from this client
+const requestLimiter = new TokenBucket(perplexityConfig.burstLimit, perplexityConfig.requestsPerMinute);
+
+// Cap requests in flight at once; backoff sleeps between retries don't hold a slot
+const requestSlots = new Semaphore(perplexityConfig.maxConcurrentRequests);
+
+// Stop waiting out timeouts while Perplexity is down; only outages count, not bad requests
+const circuitBreaker = new CircuitBreaker(
+  'Perplexity API',
+  perplexityConfig.circuitFailureThreshold,
+  perplexityConfig.circuitCooldownMs,
+  error => error instanceof TransientError
+);
 
 export interface PerplexityResponse {
   id: string;
@@ -36,6 +161,13 @@ export class PerplexityService {
   private apiKey: string;
   private apiUrl: string;
   private model: string;
+  // Identical content gets an identical verdict; skip the round trip for repeats
+  private resultCache = new TtlCache<VerificationResult>(
+    perplexityConfig.cacheMaxEntries,
+    perplexityConfig.cacheTtlMs
+  );
+  // Concurrent requests for the same content share one API call
+  private inflight = new SingleFlight<VerificationResult>();
 
   constructor() {
     this.apiKey = perplexityConfig.apiKey;
@@ -48,15 +180,17 @@ export class PerplexityService {
       throw new Error('Perplexity API key not configured');
     }
 
-    try {
-      const prompt = this.buildVerificationPrompt(content);
-      const response = await this.callPerplexityAPI(prompt);
-      
-      return this.parseVerificationResponse(response);
-    } catch (error) {
-      console.error('Perplexity verification failed:', error);
-      throw new Error(`Verification failed: ${error instanceof Error ? error.message : 'Unknown error'}`);
-    }
+    return this.getCachedOrFetch(`verify:${content}`, async () => {
+      try {
+        const prompt = this.buildVerificationPrompt(content);
+        const response = await this.callPerplexityAPI(prompt);
+        
+        return this.parseVerificationResponse(response);
+      } catch (error) {
+        console.error('Perplexity verification failed:', error);
+        throw new Error(`Verification failed: ${error instanceof Error ? error.message : 'Unknown error'}`);
+      }
+    });
   }
 
   async factCheck(claim: string): Promise<VerificationResult> {
@@ -64,18 +198,52 @@ export class PerplexityService {
       throw new Error('Perplexity API key not configured');
     }
 
-    try {
-      const prompt = this.buildFactCheckPrompt(claim);
-      const response = await this.callPerplexityAPI(prompt);
-      
-      return this.parseVerificationResponse(response);
-    } catch (error) {
-      console.error('Perplexity fact-check failed:', error);
-      throw new Error(`Fact-check failed: ${error instanceof Error ? error.message : 'Unknown error'}`);
+    return this.getCachedOrFetch(`factcheck:${claim}`, async () => {
+      try {
+        const prompt = this.buildFactCheckPrompt(claim);
+        const response = await this.callPerplexityAPI(prompt);
+        
+        return this.parseVerificationResponse(response);
+      } catch (error) {
+        console.error('Perplexity fact-check failed:', error);
+        throw new Error(`Fact-check failed: ${error instanceof Error ? error.message : 'Unknown error'}`);
+      }
+    });
+  }
+
+  private async getCachedOrFetch(
+    cacheKey: string,
+    fetchResult: () => Promise<VerificationResult>
+  ): Promise<VerificationResult> {
+    const load = () => this.inflight.do(cacheKey, async () => {
+      const result = await fetchResult();
+      this.resultCache.set(cacheKey, result);
+      return result;
+    });
+
+    const cached = this.resultCache.get(cacheKey);
+    if (!cached) {
+      return load();
     }
+
+    // Stale-while-revalidate: answer from cache now, refresh in the background for later callers
+    const age = this.resultCache.getAge(cacheKey) ?? 0;
+    if (age >= perplexityConfig.cacheRefreshAfterMs) {
+      load().catch(() => {
+        // Already logged by fetchResult; keep serving the cached verdict until it expires
+      });
+    }
+    return cached;
   }
 
   private async callPerplexityAPI(prompt: string): Promise<PerplexityResponse> {
+    // Retry once on rate limits, 5xx responses and timeouts before giving up
+    return circuitBreaker.run(() => withRetry(() => requestSlots.run(() => this.requestCompletion(prompt))));
+  }
+
+  private async requestCompletion(prompt: string): Promise<PerplexityResponse> {
+    await requestLimiter.acquire();
+
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), perplexityConfig.timeout);
 
@@ -91,7 +259,7 @@ export class PerplexityService {
           messages: [
             {
               role: 'system',
-              content: 'You are a fact-checking assistant. Analyze the provided content for accuracy and provide a structured response with verification status, confidence level, and reasoning.'
+              content: SYSTEM_PROMPT
             },
             {
               role: 'user',
@@ -109,8 +277,14 @@ export class PerplexityService {
       clearTimeout(timeoutId);
 
       if (!response.ok) {
+        const retryAfterMs = parseRetryAfter(response.headers.get('retry-after'));
+        if (response.status === 429 && retryAfterMs) {
+          requestLimiter.pauseFor(retryAfterMs);
+        }
+
         const errorData = await response.json().catch(() => ({}));
-        throw new Error(`Perplexity API error: ${response.status} - ${errorData.error?.message || response.statusText}`);
+        const message = `Perplexity API error: ${response.status} - ${errorData.error?.message || response.statusText}`;
+        throw response.status === 429 || response.status >= 500 ? new TransientError(message, retryAfterMs) : new Error(message);
       }
 
       return await response.json();
@@ -118,7 +292,7 @@ export class PerplexityService {
       clearTimeout(timeoutId);
       
       if (error instanceof Error && error.name === 'AbortError') {
-        throw new Error('Perplexity API request timed out');
+        throw new TransientError('Perplexity API request timed out');
       }
       
       throw error;
@@ -126,69 +300,11 @@ export class PerplexityService {
   }
 
   private buildVerificationPrompt(content: string): string {
-    return `You are a fact-checking expert. Analyze the following content for factual accuracy. Be especially critical of claims that seem unlikely or extraordinary.
-
-Content to verify:
-"${content}"
-
-IMPORTANT: If the content contains false information, misinformation, or claims that are not supported by evidence, set "isAccurate" to false and provide a high confidence score (0.8-0.95) in your assessment.
-
-Examples of false claims to flag:
-- Celebrities winning awards they never received (e.g., "Elon Musk won a Nobel Peace Prize")
-- Historical events that never happened
-- Scientific claims that contradict established knowledge
-- Medical misinformation
-
-Respond in JSON format:
-{
-  "isAccurate": true/false,
-  "confidence": 0.0-1.0 (how confident you are in your assessment),
-  "summary": "Brief explanation of verification result",
-  "reasoning": "Detailed reasoning for the assessment",
-  "sources": ["list of relevant sources if available"]
-}
-
-Evaluation criteria:
-1. Factual accuracy of claims made
-2. Cross-reference with reliable sources and established facts
-3. Flag extraordinary claims that lack evidence
-4. Be skeptical of claims that seem too good to be true
-5. Check for common misinformation patterns
-
-If you find the content contains false information, be confident in marking it as inaccurate.`;
+    return `${VERIFICATION_PROMPT_HEADER}"${content}"${VERIFICATION_PROMPT_INSTRUCTIONS}`;
   }
 
   private buildFactCheckPrompt(claim: string): string {
-    return `You are a professional fact-checker. Analyze this claim with high scrutiny and skepticism.
-
-Claim to fact-check:
-"${claim}"
-
-CRITICAL: If this claim is false or misleading, you must set "isAccurate" to false with high confidence (0.85-0.95).
-
-Common false claims to watch for:
-- Nobel Prize winners who never won (especially celebrities like Elon Musk, Taylor Swift, etc.)
-- Historical events that never occurred
-- Scientific "facts" that are actually myths
-- Celebrity achievements that are fabricated
-
-Respond in JSON format:
-{
-  "isAccurate": true/false,
-  "confidence": 0.0-1.0 (confidence in your fact-check assessment),
-  "summary": "Brief fact-check result",
-  "reasoning": "Detailed explanation with evidence",
-  "sources": ["relevant sources that support or refute the claim"]
-}
-
-Fact-checking process:
-1. Whether the claim is factually correct
-2. Search for contradicting evidence
-3. Verify against authoritative sources
-4. Consider the plausibility of the claim
-5. Check for common misinformation patterns
-
-Be confident in your assessment - if something is clearly false, mark it as such with high confidence.`;
+    return `${FACT_CHECK_PROMPT_HEADER}"${claim}"${FACT_CHECK_PROMPT_INSTRUCTIONS}`;
   }
 
   private parseVerificationResponse(response: PerplexityResponse): VerificationResult {
@@ -198,35 +314,16 @@ Be confident in your assessment - if something is clearly false, mark it as such
         throw new Error('No content in Perplexity response');
       }
 
-      // First try to extract JSON from markdown code blocks
-      let jsonString = this.extractJsonFromMarkdown(content);
+      // Prefer a fenced JSON block, then fall back to the outermost braces in the text
+      const parsed = this.parseJson(this.extractJsonFromMarkdown(content) ?? this.extractJsonFromText(content));
       
-      // If no markdown block found, try to find JSON object in text
-      if (!jsonString) {
-        jsonString = this.extractJsonFromText(content);
-      }
-      
-      // Try to parse the extracted JSON
-      if (jsonString) {
-        const parsed = JSON.parse(jsonString);
-        
+      if (parsed) {
         // Enhanced validation and confidence adjustment
         let confidence = Math.max(0, Math.min(1, parsed.confidence || 0));
         const isAccurate = parsed.isAccurate || false;
         
-        // Special handling for known false claims
-        const content = response.choices[0]?.message?.content?.toLowerCase() || '';
-        const knownFalseClaims = [
-          'elon musk.*nobel peace prize',
-          'taylor swift.*nobel peace prize',
-          'jeff bezos.*nobel peace prize',
-          'mark zuckerberg.*nobel peace prize'
-        ];
-        
         // If content mentions known false claims, ensure high confidence in inaccuracy
-        const containsFalseClaim = knownFalseClaims.some(pattern => 
-          new RegExp(pattern, 'i').test(content)
-        );
+        const containsFalseClaim = KNOWN_FALSE_CLAIM_REGEX.test(content);
         
         if (containsFalseClaim && !isAccurate) {
           confidence = Math.max(confidence, 0.9); // Ensure high confidence for known false claims
@@ -278,69 +375,38 @@ Be confident in your assessment - if something is clearly false, mark it as such
     const firstBrace = content.indexOf('{');
     const lastBrace = content.lastIndexOf('}');
     
-    if (firstBrace !== -1 && lastBrace !== -1 && firstBrace < lastBrace) {
-      const potentialJson = content.substring(firstBrace, lastBrace + 1);
-      
-      // Basic validation - check if it looks like JSON structure
-      if (this.isValidJsonStructure(potentialJson)) {
-        return potentialJson;
-      }
+    if (firstBrace !== -1 && firstBrace < lastBrace) {
+      return content.substring(firstBrace, lastBrace + 1);
     }
     
     return null;
   }
 
-  private isValidJsonStructure(str: string): boolean {
-    // Basic checks for JSON-like structure
-    const trimmed = str.trim();
-    if (!trimmed.startsWith('{') || !trimmed.endsWith('}')) {
-      return false;
+  private parseJson(jsonString: string | null): any | null {
+    // JSON.parse is the structure check; a separate brace-balancing pass only duplicated it
+    if (!jsonString) {
+      return null;
     }
-    
-    // Count braces to ensure they're balanced
-    let braceCount = 0;
-    for (const char of trimmed) {
-      if (char === '{') braceCount++;
-      if (char === '}') braceCount--;
-      if (braceCount < 0) return false;
+
+    try {
+      return JSON.parse(jsonString);
+    } catch {
+      return null;
     }
-    
-    return braceCount === 0;
   }
 
   private analyzeTextForAccuracy(text: string): boolean {
-    const inaccurateIndicators = [
-      'false', 'incorrect', 'inaccurate', 'misleading', 'misinformation',
-      'not true', 'fabricated', 'unverified', 'disputed', 'debunked',
-      'never won', 'never received', 'did not win', 'has not won',
-      'no evidence', 'no record', 'unfounded', 'baseless'
-    ];
-    
-    const accurateIndicators = [
-      'accurate', 'correct', 'true', 'verified', 'confirmed',
-      'supported by evidence', 'factual', 'reliable', 'documented'
-    ];
-
     const textLower = text.toLowerCase();
     
     // Check for specific false claim patterns
-    const falseClaims = [
-      'elon musk.*nobel peace prize',
-      'taylor swift.*nobel peace prize'
-    ];
-    
-    const containsFalseClaim = falseClaims.some(pattern => 
-      new RegExp(pattern, 'i').test(textLower)
-    );
-    
-    if (containsFalseClaim) {
+    if (STATED_FALSE_CLAIM_REGEX.test(textLower)) {
       return false; // Definitely inaccurate
     }
     
-    const inaccurateScore = inaccurateIndicators.reduce((score, indicator) => 
+    const inaccurateScore = INACCURATE_INDICATORS.reduce((score, indicator) => 
       score + (textLower.includes(indicator) ? 1 : 0), 0);
     
-    const accurateScore = accurateIndicators.reduce((score, indicator) => 
+    const accurateScore = ACCURATE_INDICATORS.reduce((score, indicator) => 
       score + (textLower.includes(indicator) ? 1 : 0), 0);
 
     // Be more conservative - require stronger evidence for accuracy
@@ -354,38 +420,15 @@ Be confident in your assessment - if something is clearly false, mark it as such
       return parseInt(percentageMatch[1]) / 100;
     }
 
-    // Look for confidence words
-    const confidenceWords = {
-      'very confident': 0.9,
-      'highly confident': 0.9,
-      'definitely false': 0.95,
-      'clearly false': 0.9,
-      'obviously false': 0.9,
-      'confident': 0.8,
-      'likely': 0.7,
-      'probably': 0.6,
-      'possibly': 0.5,
-      'uncertain': 0.4,
-      'unlikely': 0.3,
-      'doubtful': 0.2,
-      'never won': 0.9, // High confidence when stating someone never won something
-      'no evidence': 0.85,
-      'no record': 0.85
-    };
-
     const textLower = text.toLowerCase();
     
     // Check for false claim indicators first
-    const falseClaims = ['elon musk.*never.*nobel', 'taylor swift.*never.*nobel'];
-    const containsFalseClaimEvidence = falseClaims.some(pattern => 
-      new RegExp(pattern, 'i').test(textLower)
-    );
-    
-    if (containsFalseClaimEvidence) {
+    if (FALSE_CLAIM_DENIAL_REGEX.test(textLower)) {
       return 0.9; // High confidence when explicitly stating false claims
     }
     
-    for (const [phrase, confidence] of Object.entries(confidenceWords)) {
+    // Look for confidence words
+    for (const [phrase, confidence] of CONFIDENCE_PHRASES) {
       if (textLower.includes(phrase)) {
         return confidence;
       }
@@ -7,6 +7,21 @@ import type {
   Agent,
   Feedback 
 } from '../types';
+import { SingleFlight } from '../utils/singleFlight';
+import { TtlCache } from '../utils/ttlCache';
+
+// Policies and agents change rarely but are looked up for every processed interaction
+const LOOKUP_TTL_MS = 60 * 1000;
+// Every caller shares the cached arrays, so they are frozen and handed out read-only
+const policiesCache = new TtlCache<readonly Policy[]>(2, LOOKUP_TTL_MS);
+const agentsCache = new TtlCache<readonly Agent[]>(2, LOOKUP_TTL_MS);
+// Concurrent cache misses share one query instead of each hitting the database
+const policiesInflight = new SingleFlight<readonly Policy[]>();
+const agentsInflight = new SingleFlight<readonly Agent[]>();
+// Bumped on every write so a query that started before the write neither caches its
+// stale result nor gets shared with callers that arrive after it
+let policiesGeneration = 0;
+let agentsGeneration = 0;
 
 /**
  * Supabase Service Layer
@@ -126,6 +141,32 @@ export async function createViolation(data: {
   return violation as Violation;
 }
 
+export async function createViolations(rows: Array<{
+  interaction_id: string;
+  policy_id: string;
+  severity: string;
+  description?: string;
+  detected_by_agent_id?: string;
+  metadata?: any;
+}>): Promise<Violation[]> {
+  if (rows.length === 0) {
+    return [];
+  }
+
+  // One multi-row insert instead of a request per violation
+  const { data: violations, error } = await supabase
+    .from('violations')
+    .insert(rows)
+    .select();
+
+  if (error) {
+    console.error('Error creating violations:', error);
+    return [];
+  }
+
+  return violations as Violation[];
+}
+
 export async function getViolations(
   filters?: {
     is_resolved?: boolean;
@@ -218,6 +259,58 @@ export async function createAuditLog(data: {
   return log as AuditLog;
 }
 
+// Fire-and-forget audit logs are buffered briefly and written in one insert
+const AUDIT_LOG_BATCH_SIZE = 32;
+const AUDIT_LOG_FLUSH_MS = 50;
+
+type AuditLogInput = Parameters<typeof createAuditLog>[0];
+
+let pendingAuditLogs: Array<{ data: AuditLogInput; resolve: () => void }> = [];
+let auditLogFlushTimer: ReturnType<typeof setTimeout> | null = null;
+
+async function flushAuditLogs(): Promise<void> {
+  if (auditLogFlushTimer) {
+    clearTimeout(auditLogFlushTimer);
+    auditLogFlushTimer = null;
+  }
+
+  const batch = pendingAuditLogs;
+  pendingAuditLogs = [];
+  if (batch.length === 0) return;
+
+  try {
+    const { error } = await supabase
+      .from('audit_logs')
+      .insert(batch.map(entry => entry.data));
+
+    if (error) {
+      console.error('Error creating audit logs:', error);
+    }
+  } catch (error) {
+    console.error('Error creating audit logs:', error);
+  } finally {
+    // Logging is best-effort; never leave callers waiting on a failed batch
+    batch.forEach(entry => entry.resolve());
+  }
+}
+
+/**
+ * Queue an audit log for a batched insert. Callers should not await this on a hot
+ * path, since the batch waits up to AUDIT_LOG_FLUSH_MS; the promise resolves once
+ * the batch has been written. Use createAuditLog instead when the row is needed.
+ */
+export function enqueueAuditLog(data: AuditLogInput): Promise<void> {
+  return new Promise(resolve => {
+    pendingAuditLogs.push({ data, resolve });
+
+    if (pendingAuditLogs.length >= AUDIT_LOG_BATCH_SIZE) {
+      flushAuditLogs();
+    } else if (!auditLogFlushTimer) {
+      auditLogFlushTimer = setTimeout(flushAuditLogs, AUDIT_LOG_FLUSH_MS);
+    }
+  });
+}
+
 export async function getAuditLogs(
   filters?: {
     level?: string;
@@ -265,24 +358,37 @@ export async function getAuditLogs(
 // POLICIES
 // ============================================
 
-export async function getPolicies(active_only = true): Promise<Policy[]> {
-  let query = supabase
-    .from('policies')
-    .select('*')
-    .order('severity', { ascending: false });
-
-  if (active_only) {
-    query = query.eq('is_active', true);
+export async function getPolicies(active_only = true): Promise<readonly Policy[]> {
+  const cacheKey = `active_only:${active_only}`;
+  const cached = policiesCache.get(cacheKey);
+  if (cached) {
+    return cached;
   }
 
-  const { data, error } = await query;
+  const generation = policiesGeneration;
+  return policiesInflight.do(`${cacheKey}:${generation}`, async () => {
+    let query = supabase
+      .from('policies')
+      .select('*')
+      .order('severity', { ascending: false });
 
-  if (error) {
-    console.error('Error fetching policies:', error);
-    return [];
-  }
+    if (active_only) {
+      query = query.eq('is_active', true);
+    }
 
-  return data as Policy[];
+    const { data, error } = await query;
+
+    if (error) {
+      console.error('Error fetching policies:', error);
+      return [];
+    }
+
+    const policies = Object.freeze(data as Policy[]);
+    if (generation === policiesGeneration) {
+      policiesCache.set(cacheKey, policies);
+    }
+    return policies;
+  });
 }
 
 export async function createPolicy(data: {
@@ -304,6 +410,8 @@ export async function createPolicy(data: {
     return null;
   }
 
+  policiesGeneration++;
+  policiesCache.clear();
   return policy as Policy;
 }
 
@@ -323,6 +431,8 @@ export async function updatePolicy(
     return null;
   }
 
+  policiesGeneration++;
+  policiesCache.clear();
   return data as Policy;
 }
 
@@ -330,24 +440,37 @@ export async function updatePolicy(
 // AGENTS
 // ============================================
 
-export async function getAgents(active_only = true): Promise<Agent[]> {
-  let query = supabase
-    .from('agents')
-    .select('*')
-    .order('performance_score', { ascending: false });
-
-  if (active_only) {
-    query = query.eq('is_active', true);
+export async function getAgents(active_only = true): Promise<readonly Agent[]> {
+  const cacheKey = `active_only:${active_only}`;
+  const cached = agentsCache.get(cacheKey);
+  if (cached) {
+    return cached;
   }
 
-  const { data, error } = await query;
+  const generation = agentsGeneration;
+  return agentsInflight.do(`${cacheKey}:${generation}`, async () => {
+    let query = supabase
+      .from('agents')
+      .select('*')
+      .order('performance_score', { ascending: false });
 
-  if (error) {
-    console.error('Error fetching agents:', error);
-    return [];
-  }
+    if (active_only) {
+      query = query.eq('is_active', true);
+    }
+
+    const { data, error } = await query;
+
+    if (error) {
+      console.error('Error fetching agents:', error);
+      return [];
+    }
 
-  return data as Agent[];
+    const agents = Object.freeze(data as Agent[]);
+    if (generation === agentsGeneration) {
+      agentsCache.set(cacheKey, agents);
+    }
+    return agents;
+  });
 }
 
 export async function updateAgentStatus(
@@ -369,6 +492,8 @@ export async function updateAgentStatus(
     return null;
   }
 
+  agentsGeneration++;
+  agentsCache.clear();
   return data as Agent;
 }
 
@@ -406,44 +531,54 @@ export async function createFeedback(data: {
 export async function getStatistics(days = 7) {
   const startDate = new Date();
   startDate.setDate(startDate.getDate() - days);
-
-  // Get total interactions
-  const { count: totalInteractions } = await supabase
-    .from('interactions')
-    .select('*', { count: 'exact', head: true })
-    .gte('created_at', startDate.toISOString());
-
-  // Get compliant interactions
-  const { count: compliantInteractions } = await supabase
-    .from('interactions')
-    .select('*', { count: 'exact', head: true })
-    .eq('compliance_status', 'compliant')
-    .gte('created_at', startDate.toISOString());
-
-  // Get active violations
-  const { count: activeViolations } = await supabase
-    .from('violations')
-    .select('*', { count: 'exact', head: true })
-    .eq('is_resolved', false)
-    .gte('detected_at', startDate.toISOString());
-
-  // Get average safety score
-  const { data: safetyData } = await supabase
-    .from('interactions')
-    .select('safety_score')
-    .gte('created_at', startDate.toISOString());
+  const since = startDate.toISOString();
+
+  // The queries are independent, so issue them concurrently
+  const [
+    { count: totalInteractions },
+    { count: compliantInteractions },
+    { count: activeViolations },
+    { data: safetyData },
+    { data: timeData }
+  ] = await Promise.all([
+    // Get total interactions
+    supabase
+      .from('interactions')
+      .select('*', { count: 'exact', head: true })
+      .gte('created_at', since),
+
+    // Get compliant interactions
+    supabase
+      .from('interactions')
+      .select('*', { count: 'exact', head: true })
+      .eq('compliance_status', 'compliant')
+      .gte('created_at', since),
+
+    // Get active violations
+    supabase
+      .from('violations')
+      .select('*', { count: 'exact', head: true })
+      .eq('is_resolved', false)
+      .gte('detected_at', since),
+
+    // Get safety scores
+    supabase
+      .from('interactions')
+      .select('safety_score')
+      .gte('created_at', since),
+
+    // Get processing times
+    supabase
+      .from('interactions')
+      .select('processing_time_ms')
+      .gte('created_at', since)
+      .not('processing_time_ms', 'is', null)
+  ]);
 
   const avgSafetyScore = safetyData && safetyData.length > 0
     ? safetyData.reduce((acc, curr) => acc + (curr.safety_score || 0), 0) / safetyData.length
     : 0;
 
-  // Get average processing time
-  const { data: timeData } = await supabase
-    .from('interactions')
-    .select('processing_time_ms')
-    .gte('created_at', startDate.toISOString())
-    .not('processing_time_ms', 'is', null);
-
   const avgProcessingTime = timeData && timeData.length > 0
     ? timeData.reduce((acc, curr) => acc + (curr.processing_time_ms || 0), 0) / timeData.length
     : 0;
@@ -534,11 +669,13 @@ export default {
   
   // Violations
   createViolation,
+  createViolations,
   getViolations,
   resolveViolation,
   
   // Audit Logs
   createAuditLog,
+  enqueueAuditLog,
   getAuditLogs,
   
   // Policies
@@ -18,79 +18,75 @@ export const getAgentIcon = (name: string) => {
   }
 };
 
-export const getAgentActionConfig = (action: string) => {
-  switch (action) {
-    case 'flag':
-      return {
-        icon: AlertTriangle,
-        color: 'bg-gradient-to-r from-yellow-100 to-yellow-200 text-yellow-900 border-yellow-400 shadow-md',
-        iconColor: 'text-yellow-600',
-        emoji: '⚠️'
-      };
-    case 'block':
-      return {
-        icon: XCircle,
-        color: 'bg-gradient-to-r from-red-100 to-red-200 text-red-900 border-red-400 shadow-md',
-        iconColor: 'text-red-600',
-        emoji: '🚫'
-      };
-    case 'approve':
-      return {
-        icon: CheckCircle,
-        color: 'bg-gradient-to-r from-green-50 to-green-100 text-green-800 border-green-300 shadow-sm',
-        iconColor: 'text-green-600',
-        emoji: '✅'
-      };
-    case 'suggest':
-      return {
-        icon: AlertTriangle,
-        color: 'bg-gradient-to-r from-yellow-50 to-yellow-100 text-yellow-800 border-yellow-300 shadow-sm',
-        iconColor: 'text-yellow-600',
-        emoji: '💡'
-      };
-    case 'log':
-      return {
-        icon: FileText,
-        color: 'bg-gradient-to-r from-blue-50 to-blue-100 text-blue-800 border-blue-300 shadow-sm',
-        iconColor: 'text-blue-600',
-        emoji: '📝'
-      };
-    default:
-      return {
-        icon: Clock,
-        color: 'bg-gradient-to-r from-gray-50 to-gray-100 text-gray-800 border-gray-300 shadow-sm',
-        iconColor: 'text-gray-600',
-        emoji: '⏳'
-      };
+// Built once at module load; badges re-render often and the configs never change
+const AGENT_ACTION_CONFIGS = {
+  flag: {
+    icon: AlertTriangle,
+    color: 'bg-gradient-to-r from-yellow-100 to-yellow-200 text-yellow-900 border-yellow-400 shadow-md',
+    iconColor: 'text-yellow-600',
+    emoji: '⚠️'
+  },
+  block: {
+    icon: XCircle,
+    color: 'bg-gradient-to-r from-red-100 to-red-200 text-red-900 border-red-400 shadow-md',
+    iconColor: 'text-red-600',
+    emoji: '🚫'
+  },
+  approve: {
+    icon: CheckCircle,
+    color: 'bg-gradient-to-r from-green-50 to-green-100 text-green-800 border-green-300 shadow-sm',
+    iconColor: 'text-green-600',
+    emoji: '✅'
+  },
+  suggest: {
+    icon: AlertTriangle,
+    color: 'bg-gradient-to-r from-yellow-50 to-yellow-100 text-yellow-800 border-yellow-300 shadow-sm',
+    iconColor: 'text-yellow-600',
+    emoji: '💡'
+  },
+  log: {
+    icon: FileText,
+    color: 'bg-gradient-to-r from-blue-50 to-blue-100 text-blue-800 border-blue-300 shadow-sm',
+    iconColor: 'text-blue-600',
+    emoji: '📝'
   }
-};
+} as const;
+
+const DEFAULT_AGENT_ACTION_CONFIG = {
+  icon: Clock,
+  color: 'bg-gradient-to-r from-gray-50 to-gray-100 text-gray-800 border-gray-300 shadow-sm',
+  iconColor: 'text-gray-600',
+  emoji: '⏳'
+} as const;
 
-// Safety badge configurations
-export const getSafetyStatusConfig = (status: 'safe' | 'flagged' | 'blocked', violationCount: number = 0) => {
-  switch (status) {
-    case 'safe':
-      return {
-        icon: CheckCircle,
-        color: 'bg-gradient-to-r from-emerald-50 to-green-100 text-emerald-800 border-emerald-300 shadow-lg',
-        iconColor: 'text-green-600',
-        label: '✅ SAFE',
-        description: 'No violations detected'
-      };
-    case 'flagged':
-      return {
-        icon: AlertTriangle,
-        color: 'bg-gradient-to-r from-amber-50 to-yellow-100 text-amber-800 border-amber-300 shadow-lg',
-        iconColor: 'text-amber-600',
-        label: '⚠️ FLAGGED',
-        description: `${violationCount} violation${violationCount !== 1 ? 's' : ''} detected`
-      };
-    case 'blocked':
-      return {
-        icon: XCircle,
-        color: 'bg-gradient-to-r from-red-50 to-red-100 text-red-800 border-red-300 shadow-lg',
-        iconColor: 'text-red-600',
-        label: '❌ BLOCKED',
-        description: `${violationCount} violation${violationCount !== 1 ? 's' : ''} detected`
-      };
+export const getAgentActionConfig = (action: string) =>
+  AGENT_ACTION_CONFIGS[action as keyof typeof AGENT_ACTION_CONFIGS] ?? DEFAULT_AGENT_ACTION_CONFIG;
+
+// Safety badge configurations; only the description depends on the violation count
+const SAFETY_STATUS_STYLES = {
+  safe: {
+    icon: CheckCircle,
+    color: 'bg-gradient-to-r from-emerald-50 to-green-100 text-emerald-800 border-emerald-300 shadow-lg',
+    iconColor: 'text-green-600',
+    label: '✅ SAFE'
+  },
+  flagged: {
+    icon: AlertTriangle,
+    color: 'bg-gradient-to-r from-amber-50 to-yellow-100 text-amber-800 border-amber-300 shadow-lg',
+    iconColor: 'text-amber-600',
+    label: '⚠️ FLAGGED'
+  },
+  blocked: {
+    icon: XCircle,
+    color: 'bg-gradient-to-r from-red-50 to-red-100 text-red-800 border-red-300 shadow-lg',
+    iconColor: 'text-red-600',
+    label: '❌ BLOCKED'
   }
-};
+} as const;
+
+export const getSafetyStatusConfig = (status: 'safe' | 'flagged' | 'blocked', violationCount: number = 0) => ({
+  ...SAFETY_STATUS_STYLES[status],
+  description: status === 'safe'
+    ? 'No violations detected'
+    : `${violationCount} violation${violationCount !== 1 ? 's' : ''} detected`
+});
@@ -0,0 +1,60 @@
+/**
+ * Error thrown instead of calling the dependency while the circuit is open
+ */
+export class CircuitOpenError extends Error {
+  constructor(message: string) {
+    super(message);
+    this.name = 'CircuitOpenError';
+  }
+}
+
+/**
+ * Fails fast after repeated failures so callers stop waiting on a degraded dependency.
+ * After the cooldown exactly one trial call is let through while concurrent callers
+ * still fail fast; success closes the circuit, failure opens it again.
+ */
+export class CircuitBreaker {
+  private consecutiveFailures: number = 0;
+  private openUntil: number = 0;
+  private probeInFlight: boolean = false;
+  private readonly name: string;
+  private readonly failureThreshold: number;
+  private readonly cooldownMs: number;
+  private readonly isFailure: (error: unknown) => boolean;
+
+  constructor(
+    name: string,
+    failureThreshold: number = 5,
+    cooldownMs: number = 30000,
+    isFailure: (error: unknown) => boolean = () => true
+  ) {
+    this.name = name;
+    this.failureThreshold = failureThreshold;
+    this.cooldownMs = cooldownMs;
+    this.isFailure = isFailure;
+  }
+
+  async run<T>(fn: () => Promise<T>): Promise<T> {
+    // Half-open: once the cooldown has passed, a single caller probes while the rest keep failing fast
+    const isProbe = this.openUntil > 0 && Date.now() >= this.openUntil && !this.probeInFlight;
+    if (this.openUntil > 0 && !isProbe) {
+      throw new CircuitOpenError(`${this.name} temporarily unavailable after repeated failures`);
+    }
+
+    if (isProbe) this.probeInFlight = true;
+    try {
+      const result = await fn();
+      this.consecutiveFailures = 0;
+      this.openUntil = 0;
+      return result;
+    } catch (error) {
+      if (this.isFailure(error) && ++this.consecutiveFailures >= this.failureThreshold) {
+        this.openUntil = Date.now() + this.cooldownMs;
+        console.warn(`⚡ ${this.name} circuit open for ${this.cooldownMs / 1000}s`);
+      }
+      throw error;
+    } finally {
+      if (isProbe) this.probeInFlight = false;
+    }
+  }
+}
@@ -24,6 +24,17 @@ export class InputSanitizer {
     /&[#\w]+;/g,
   ];
 
+  private static readonly INJECTION_PATTERNS = [
+    /ignore\s+previous\s+instructions/i,
+    /forget\s+everything/i,
+    /you\s+are\s+now/i,
+    /new\s+instructions/i,
+    /system\s+override/i,
+    /developer\s+mode/i,
+    /jailbreak/i,
+    /roleplay\s+as/i,
+  ];
+
   private static readonly MAX_LENGTH = 5000;
   private static readonly MIN_LENGTH = 1;
 
@@ -78,17 +89,6 @@ export class InputSanitizer {
   }
 
   static isPromptInjection(input: string): boolean {
-    const injectionPatterns = [
-      /ignore\s+previous\s+instructions/i,
-      /forget\s+everything/i,
-      /you\s+are\s+now/i,
-      /new\s+instructions/i,
-      /system\s+override/i,
-      /developer\s+mode/i,
-      /jailbreak/i,
-      /roleplay\s+as/i,
-    ];
-
-    return injectionPatterns.some(pattern => pattern.test(input));
+    return this.INJECTION_PATTERNS.some(pattern => pattern.test(input));
   }
 }
\ No newline at end of file
@@ -1,60 +1,74 @@
-interface RateLimitEntry {
-  count: number;
-  resetTime: number;
+interface TokenBucket {
+  tokens: number;
+  lastRefill: number;
 }
 
+// Token bucket: bursts up to maxRequests, then refills continuously at
+// maxRequests per window instead of resetting all at once
 class RateLimiter {
-  private limits: Map<string, RateLimitEntry> = new Map();
+  private buckets: Map<string, TokenBucket> = new Map();
   private readonly maxRequests: number;
   private readonly windowMs: number;
+  private readonly refillPerMs: number;
 
   constructor(maxRequests: number = 10, windowMs: number = 60000) {
     this.maxRequests = maxRequests;
     this.windowMs = windowMs;
+    this.refillPerMs = maxRequests / windowMs;
   }
 
-  isAllowed(identifier: string): boolean {
+  private refill(identifier: string): TokenBucket {
     const now = Date.now();
-    const entry = this.limits.get(identifier);
-
-    if (!entry || now > entry.resetTime) {
-      // Reset or create new entry
-      this.limits.set(identifier, {
-        count: 1,
-        resetTime: now + this.windowMs
-      });
-      return true;
+    const bucket = this.buckets.get(identifier);
+
+    if (!bucket) {
+      const fresh = { tokens: this.maxRequests, lastRefill: now };
+      this.buckets.set(identifier, fresh);
+      return fresh;
     }
 
-    if (entry.count >= this.maxRequests) {
+    bucket.tokens = Math.min(this.maxRequests, bucket.tokens + (now - bucket.lastRefill) * this.refillPerMs);
+    bucket.lastRefill = now;
+    return bucket;
+  }
+
+  isAllowed(identifier: string): boolean {
+    const bucket = this.refill(identifier);
+
+    if (bucket.tokens < 1) {
       return false;
     }
 
-    entry.count++;
+    bucket.tokens -= 1;
     return true;
   }
 
   getRemainingRequests(identifier: string): number {
-    const entry = this.limits.get(identifier);
-    if (!entry || Date.now() > entry.resetTime) {
+    if (!this.buckets.has(identifier)) {
       return this.maxRequests;
     }
-    return Math.max(0, this.maxRequests - entry.count);
+    return Math.floor(this.refill(identifier).tokens);
   }
 
+  // Time at which the next request will be allowed, or 0 if one is allowed now
   getResetTime(identifier: string): number {
-    const entry = this.limits.get(identifier);
-    if (!entry || Date.now() > entry.resetTime) {
+    if (!this.buckets.has(identifier)) {
       return 0;
     }
-    return entry.resetTime;
+
+    const bucket = this.refill(identifier);
+    if (bucket.tokens >= 1) {
+      return 0;
+    }
+    return bucket.lastRefill + Math.ceil((1 - bucket.tokens) / this.refillPerMs);
   }
 
   cleanup(): void {
     const now = Date.now();
-    for (const [key, entry] of this.limits.entries()) {
-      if (now > entry.resetTime) {
-        this.limits.delete(key);
+    for (const [key, bucket] of this.buckets.entries()) {
+      // A bucket idle for a full window has refilled completely
+      if (now - bucket.lastRefill >= this.windowMs) {
+        this.buckets.delete(key);
       }
     }
   }
@@ -62,6 +76,17 @@ class RateLimiter {
 
 export const rateLimiter = new RateLimiter(10, 60000); // 10 requests per minute
 
+let clientIdentifier: string | undefined;
+
+// In a real app, this would be based on user ID or IP address; for demo purposes
+// a browser fingerprint is used. It never changes within a page, so build it once.
+export const getClientIdentifier = (): string => {
+  if (clientIdentifier === undefined) {
+    clientIdentifier = `client_${navigator.userAgent.slice(0, 50)}`;
+  }
+  return clientIdentifier;
+};
+
 // Cleanup expired entries every 5 minutes
 setInterval(() => {
   rateLimiter.cleanup();
@@ -0,0 +1,60 @@
+export { parseRetryAfter } from './retryAfter';
+
+/**
+ * Error for failures worth retrying (rate limits, 5xx responses, timeouts)
+ */
+export class TransientError extends Error {
+  // Server-requested wait before retrying, from a Retry-After header
+  readonly retryAfterMs?: number;
+
+  constructor(message: string, retryAfterMs?: number) {
+    super(message);
+    this.name = 'TransientError';
+    this.retryAfterMs = retryAfterMs;
+  }
+}
+
+interface RetryOptions {
+  attempts?: number;
+  baseDelayMs?: number;
+  maxDelayMs?: number;
+  shouldRetry?: (error: unknown) => boolean;
+}
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+/**
+ * Run an async operation, retrying transient failures with jittered exponential backoff.
+ * A server-provided Retry-After replaces the backoff; if it is longer than maxDelayMs
+ * the error is surfaced instead of stalling the caller.
+ */
+export async function withRetry<T>(fn: () => Promise<T>, options: RetryOptions = {}): Promise<T> {
+  const {
+    attempts = 2,
+    baseDelayMs = 200,
+    maxDelayMs = 4000,
+    shouldRetry = (error: unknown) => error instanceof TransientError
+  } = options;
+
+  for (let attempt = 1; ; attempt++) {
+    try {
+      return await fn();
+    } catch (error) {
+      if (attempt >= attempts || !shouldRetry(error)) {
+        throw error;
+      }
+
+      const retryAfterMs = error instanceof TransientError ? error.retryAfterMs : undefined;
+      if (retryAfterMs !== undefined) {
+        if (retryAfterMs > maxDelayMs) {
+          throw error;
+        }
+        await sleep(retryAfterMs);
+        continue;
+      }
+
+      const backoff = Math.min(maxDelayMs, baseDelayMs * 2 ** (attempt - 1));
+      await sleep(backoff * (0.5 + Math.random()));
+    }
+  }
+}
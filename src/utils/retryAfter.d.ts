@@ -0,0 +1,4 @@
+/**
+ * Parse a Retry-After header (delta-seconds or HTTP date) into milliseconds
+ */
+export declare function parseRetryAfter(header: string | null | undefined): number | undefined;
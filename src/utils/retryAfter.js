@@ -0,0 +1,18 @@
+// Plain JavaScript so server.js can import it directly; types live in retryAfter.d.ts
+
+/**
+ * Parse a Retry-After header (delta-seconds or HTTP date) into milliseconds
+ */
+export function parseRetryAfter(header) {
+  if (!header) {
+    return undefined;
+  }
+
+  const seconds = Number(header);
+  if (!Number.isNaN(seconds)) {
+    return Math.max(0, seconds * 1000);
+  }
+
+  const date = Date.parse(header);
+  return Number.isNaN(date) ? undefined : Math.max(0, date - Date.now());
+}
@@ -0,0 +1,20 @@
+/**
+ * Coalesces concurrent calls that share a key: while a call is in flight,
+ * later callers with the same key get the same promise instead of starting their own.
+ */
+export class SingleFlight<T> {
+  private inflight: Map<string, Promise<T>> = new Map();
+
+  do(key: string, fn: () => Promise<T>): Promise<T> {
+    const existing = this.inflight.get(key);
+    if (existing) {
+      return existing;
+    }
+
+    const promise = fn().finally(() => {
+      this.inflight.delete(key);
+    });
+    this.inflight.set(key, promise);
+    return promise;
+  }
+}
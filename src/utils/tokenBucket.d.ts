@@ -0,0 +1,12 @@
+/**
+ * Async token bucket for pacing outbound API calls.
+ * acquire() waits until a token is available; callers are served in arrival order.
+ */
+export declare class TokenBucket {
+  constructor(capacity: number, refillPerMinute: number);
+
+  acquire(): Promise<void>;
+
+  // Hold every caller back, e.g. when the server answers 429 with Retry-After
+  pauseFor(ms: number): void;
+}
@@ -0,0 +1,48 @@
+// Plain JavaScript so server.js can import it directly; types live in tokenBucket.d.ts
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+/**
+ * Async token bucket for pacing outbound API calls.
+ * acquire() waits until a token is available; callers are served in arrival order.
+ */
+export class TokenBucket {
+  constructor(capacity, refillPerMinute) {
+    this.capacity = capacity;
+    this.tokens = capacity;
+    this.refillPerMs = refillPerMinute / 60000;
+    this.lastRefill = Date.now();
+    this.pausedUntil = 0;
+    this.queue = Promise.resolve();
+  }
+
+  acquire() {
+    const turn = this.queue.then(() => this.take());
+    this.queue = turn;
+    return turn;
+  }
+
+  // Hold every caller back, e.g. when the server answers 429 with Retry-After
+  pauseFor(ms) {
+    this.pausedUntil = Math.max(this.pausedUntil, Date.now() + ms);
+  }
+
+  async take() {
+    for (;;) {
+      const now = Date.now();
+      if (now < this.pausedUntil) {
+        await sleep(this.pausedUntil - now);
+        continue;
+      }
+
+      this.tokens = Math.min(this.capacity, this.tokens + (now - this.lastRefill) * this.refillPerMs);
+      this.lastRefill = now;
+
+      if (this.tokens >= 1) {
+        this.tokens -= 1;
+        return;
+      }
+
+      await sleep(Math.ceil((1 - this.tokens) / this.refillPerMs));
+    }
+  }
+}
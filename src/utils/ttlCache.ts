@@ -0,0 +1,70 @@
+interface CacheEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+/**
+ * Bounded in-memory cache with per-entry expiry.
+ * Map insertion order doubles as LRU order: reads move an entry to the back,
+ * and the front entry is evicted when the cache is full.
+ */
+export class TtlCache<V> {
+  private entries: Map<string, CacheEntry<V>> = new Map();
+  private readonly maxEntries: number;
+  private readonly ttlMs: number;
+
+  constructor(maxEntries: number = 500, ttlMs: number = 60 * 60 * 1000) {
+    this.maxEntries = maxEntries;
+    this.ttlMs = ttlMs;
+  }
+
+  get(key: string): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+
+    if (Date.now() > entry.expiresAt) {
+      this.entries.delete(key);
+      return undefined;
+    }
+
+    // Mark as most recently used
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  // Milliseconds since the entry was stored, or undefined if absent or expired
+  getAge(key: string): number | undefined {
+    const entry = this.entries.get(key);
+    if (!entry || Date.now() > entry.expiresAt) {
+      return undefined;
+    }
+    return this.ttlMs - (entry.expiresAt - Date.now());
+  }
+
+  set(key: string, value: V): void {
+    this.entries.delete(key);
+
+    if (this.entries.size >= this.maxEntries) {
+      const oldestKey = this.entries.keys().next().value;
+      if (oldestKey !== undefined) {
+        this.entries.delete(oldestKey);
+      }
+    }
+
+    this.entries.set(key, {
+      value,
+      expiresAt: Date.now() + this.ttlMs
+    });
+  }
+
+  delete(key: string): void {
+    this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}